@@ -11,8 +11,8 @@ from fastapi import APIRouter, HTTPException, Depends, Query
 from pydantic import BaseModel
 
 # Service imports
-from ..services.learning_engine import get_learning_engine, PersonalizedLearningPath, LearningRecommendation
-from ..services.skills_engine import get_skills_engine
+from ..services.learning_engine import get_learning_engine, LearningEngine, PersonalizedLearningPath, LearningRecommendation
+from ..services.skills_engine import get_skills_engine, SkillsEngine
 from ..services.user_service import get_user_service
 
 # Model imports
@@ -29,6 +29,31 @@ logger = logging.getLogger(__name__)
 # Create router
 router = APIRouter(prefix="/api/learning", tags=["learning"])
 
+# Learning statistics, gathered with conditional counts in a single query
+_STATS_DIFFICULTIES = ('beginner', 'intermediate', 'advanced', 'expert')
+_STATS_CONTENT_TYPES = ('article', 'video', 'exercise', 'quiz', 'tutorial', 'course')
+_LEARNING_STATS_QUERY = (
+    "SELECT (SELECT COUNT(*) FROM learning_paths WHERE is_active = 1), COUNT(*), "
+    + ", ".join(["COUNT(CASE WHEN difficulty = ? THEN 1 END)"] * len(_STATS_DIFFICULTIES)) + ", "
+    + ", ".join(["COUNT(CASE WHEN content_type = ? THEN 1 END)"] * len(_STATS_CONTENT_TYPES))
+    + " FROM learning_content WHERE is_active = 1"
+)
+
+
+# Dependency injection
+def get_learning_engine_dependency() -> LearningEngine:
+    """Get learning engine dependency."""
+    try:
+        return get_learning_engine()
+    except Exception as e:
+        logger.error(f"Learning service unavailable: {e}")
+        raise HTTPException(status_code=500, detail=f"Learning service unavailable: {str(e)}")
+
+
+def get_skills_engine_dependency() -> SkillsEngine:
+    """Get skills engine dependency."""
+    return get_skills_engine()
+
 
 class LearningPathGenerationRequest(BaseModel):
     """Request model for learning path generation."""
@@ -54,27 +79,30 @@ class ContentRecommendationResponse(BaseModel):
 
 
 @router.get("/health")
-async def health_check():
+async def health_check(
+    learning_engine: LearningEngine = Depends(get_learning_engine_dependency)
+):
     """Health check endpoint for learning service."""
-    try:
-        learning_engine = get_learning_engine()
-        return {
-            "status": "healthy",
-            "service": "learning_engine",
-            "message": "Learning engine is operational"
-        }
-    except Exception as e:
-        logger.error(f"Learning service health check failed: {e}")
-        raise HTTPException(status_code=500, detail=f"Learning service unavailable: {str(e)}")
+    return {
+        "status": "healthy",
+        "service": "learning_engine",
+        "message": "Learning engine is operational"
+    }
 
 
 @router.post("/generate-path", response_model=LearningPathGenerationResponse)
-async def generate_learning_path(request: LearningPathGenerationRequest):
+async def generate_learning_path(
+    request: LearningPathGenerationRequest,
+    learning_engine: LearningEngine = Depends(get_learning_engine_dependency),
+    skills_engine: SkillsEngine = Depends(get_skills_engine_dependency)
+):
     """
     Generate a personalized learning path for a user.
     
     Args:
         request: Learning path generation request
+        learning_engine: Learning engine dependency
+        skills_engine: Skills engine dependency
         
     Returns:
         LearningPathGenerationResponse: Generated learning path
@@ -82,9 +110,6 @@ async def generate_learning_path(request: LearningPathGenerationRequest):
     logger.info(f"Generating learning path for user: {request.user_id}")
     
     try:
-        learning_engine = get_learning_engine()
-        skills_engine = get_skills_engine()
-        
         # Get skill gaps if specific IDs provided
         skill_gaps = None
         if request.skill_gap_ids:
@@ -148,12 +173,16 @@ async def generate_learning_path(request: LearningPathGenerationRequest):
 
 
 @router.get("/path/{path_id}")
-async def get_learning_path(path_id: str):
+async def get_learning_path(
+    path_id: str,
+    learning_engine: LearningEngine = Depends(get_learning_engine_dependency)
+):
     """
     Get a specific learning path by ID.
     
     Args:
         path_id: Learning path ID
+        learning_engine: Learning engine dependency
         
     Returns:
         Dict: Learning path details
@@ -161,7 +190,6 @@ async def get_learning_path(path_id: str):
     logger.info(f"Getting learning path: {path_id}")
     
     try:
-        learning_engine = get_learning_engine()
         learning_path = learning_engine.get_learning_path(path_id)
         
         if not learning_path:
@@ -210,12 +238,16 @@ async def get_learning_path(path_id: str):
 
 
 @router.get("/user/{user_id}/paths")
-async def get_user_learning_paths(user_id: str):
+async def get_user_learning_paths(
+    user_id: str,
+    learning_engine: LearningEngine = Depends(get_learning_engine_dependency)
+):
     """
     Get all learning paths for a user.
     
     Args:
         user_id: User ID
+        learning_engine: Learning engine dependency
         
     Returns:
         List[Dict]: User's learning paths
@@ -223,7 +255,6 @@ async def get_user_learning_paths(user_id: str):
     logger.info(f"Getting learning paths for user: {user_id}")
     
     try:
-        learning_engine = get_learning_engine()
         learning_paths = learning_engine.get_user_learning_paths(user_id)
         
         # Convert to response format
@@ -260,7 +291,8 @@ async def get_user_learning_paths(user_id: str):
 async def get_content_recommendations(
     skill_name: str = Query(..., description="Skill name to get recommendations for"),
     difficulty: Optional[str] = Query(None, description="Difficulty level filter"),
-    limit: int = Query(10, description="Maximum number of recommendations", ge=1, le=50)
+    limit: int = Query(10, description="Maximum number of recommendations", ge=1, le=50),
+    learning_engine: LearningEngine = Depends(get_learning_engine_dependency)
 ):
     """
     Get content recommendations for a specific skill.
@@ -269,6 +301,7 @@ async def get_content_recommendations(
         skill_name: Skill name
         difficulty: Optional difficulty filter
         limit: Maximum number of recommendations
+        learning_engine: Learning engine dependency
         
     Returns:
         ContentRecommendationResponse: Content recommendations
@@ -276,8 +309,6 @@ async def get_content_recommendations(
     logger.info(f"Getting content recommendations for skill: {skill_name}")
     
     try:
-        learning_engine = get_learning_engine()
-        
         # Search for content
         content_list = learning_engine._search_existing_content(skill_name, difficulty or "beginner")
         
@@ -313,12 +344,16 @@ async def get_content_recommendations(
 
 
 @router.get("/content/{content_id}")
-async def get_learning_content(content_id: str):
+async def get_learning_content(
+    content_id: str,
+    learning_engine: LearningEngine = Depends(get_learning_engine_dependency)
+):
     """
     Get specific learning content by ID.
     
     Args:
         content_id: Content ID
+        learning_engine: Learning engine dependency
         
     Returns:
         Dict: Learning content details
@@ -326,7 +361,6 @@ async def get_learning_content(content_id: str):
     logger.info(f"Getting learning content: {content_id}")
     
     try:
-        learning_engine = get_learning_engine()
         content = learning_engine._get_content_recommendation(content_id)
         
         if not content:
@@ -358,12 +392,16 @@ async def get_learning_content(content_id: str):
 
 
 @router.post("/content")
-async def create_learning_content(content: LearningContentCreate):
+async def create_learning_content(
+    content: LearningContentCreate,
+    learning_engine: LearningEngine = Depends(get_learning_engine_dependency)
+):
     """
     Create new learning content.
     
     Args:
         content: Learning content creation data
+        learning_engine: Learning engine dependency
         
     Returns:
         Dict: Created content details
@@ -371,8 +409,6 @@ async def create_learning_content(content: LearningContentCreate):
     logger.info(f"Creating learning content: {content.title}")
     
     try:
-        learning_engine = get_learning_engine()
-        
         # Convert to content dict
         content_dict = {
             'id': content.id or str(uuid.uuid4()),
@@ -405,16 +441,19 @@ async def create_learning_content(content: LearningContentCreate):
 
 
 @router.get("/categories")
-async def get_content_categories():
+async def get_content_categories(
+    learning_engine: LearningEngine = Depends(get_learning_engine_dependency)
+):
     """
     Get available content categories and types.
     
+    Args:
+        learning_engine: Learning engine dependency
+        
     Returns:
         Dict: Content categories and micro-learning structure
     """
     try:
-        learning_engine = get_learning_engine()
-        
         return {
             "success": True,
             "content_categories": learning_engine.content_categories,
@@ -431,42 +470,30 @@ async def get_content_categories():
 
 
 @router.get("/stats")
-async def get_learning_stats():
+async def get_learning_stats(
+    learning_engine: LearningEngine = Depends(get_learning_engine_dependency)
+):
     """
     Get learning system statistics.
     
+    Args:
+        learning_engine: Learning engine dependency
+        
     Returns:
         Dict: Learning system statistics
     """
     try:
-        learning_engine = get_learning_engine()
-        
         # Get basic stats from database
         db = learning_engine.db
         
-        # Count learning paths
-        path_count = db.execute_query("SELECT COUNT(*) FROM learning_paths WHERE is_active = 1")[0][0]
-        
-        # Count learning content
-        content_count = db.execute_query("SELECT COUNT(*) FROM learning_content WHERE is_active = 1")[0][0]
-        
-        # Count by difficulty
-        difficulty_stats = {}
-        for difficulty in ['beginner', 'intermediate', 'advanced', 'expert']:
-            count = db.execute_query(
-                "SELECT COUNT(*) FROM learning_content WHERE difficulty = ? AND is_active = 1",
-                (difficulty,)
-            )[0][0]
-            difficulty_stats[difficulty] = count
-        
-        # Count by content type
-        content_type_stats = {}
-        for content_type in ['article', 'video', 'exercise', 'quiz', 'tutorial', 'course']:
-            count = db.execute_query(
-                "SELECT COUNT(*) FROM learning_content WHERE content_type = ? AND is_active = 1",
-                (content_type,)
-            )[0][0]
-            content_type_stats[content_type] = count
+        # Count paths, content, and content per difficulty and type in one query
+        row = db.execute_query(_LEARNING_STATS_QUERY, _STATS_DIFFICULTIES + _STATS_CONTENT_TYPES)[0]
+        path_count, content_count = row[0], row[1]
+        difficulty_counts = row[2:2 + len(_STATS_DIFFICULTIES)]
+        content_type_counts = row[2 + len(_STATS_DIFFICULTIES):]
+        
+        difficulty_stats = dict(zip(_STATS_DIFFICULTIES, difficulty_counts))
+        content_type_stats = dict(zip(_STATS_CONTENT_TYPES, content_type_counts))
         
         return {
             "success": True,
@@ -6,6 +6,7 @@ and skills taxonomy management.
 """
 
 from fastapi import APIRouter, HTTPException, UploadFile, File, Form, Depends, BackgroundTasks
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
 from typing import List, Optional, Dict, Any
 import logging
@@ -301,7 +302,7 @@ async def analyze_file_artifacts(
             raise HTTPException(status_code=404, detail="Assessment not found")
         
         # Process files
-        processed_contents = file_processor.process_multiple_files(files)
+        processed_contents = await run_in_threadpool(file_processor.process_multiple_files, files)
         
         # Start analysis in background
         background_tasks.add_task(
@@ -361,7 +362,7 @@ async def analyze_mixed_artifacts(
         
         # Process files if provided
         if files:
-            processed_contents = file_processor.process_multiple_files(files)
+            processed_contents = await run_in_threadpool(file_processor.process_multiple_files, files)
             artifacts.extend(processed_contents)
         
         if not artifacts:
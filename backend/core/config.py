@@ -39,6 +39,7 @@ class Settings(BaseSettings):
     app_version: str = Field(default="1.0.0", description="Application version")
     debug: bool = Field(default=False, description="Debug mode")
     log_level: str = Field(default="INFO", description="Logging level")
+    file_processing_workers: int = Field(default=1, description="Worker processes for batch file extraction (1 = serial)")
     
     # API Configuration
     api_host: str = Field(default="0.0.0.0", description="API host")
@@ -64,6 +65,14 @@ class Settings(BaseSettings):
             raise ValueError('Max tokens must be positive')
         return v
     
+    @field_validator('file_processing_workers')
+    @classmethod
+    def validate_file_processing_workers(cls, v):
+        """Validate file processing worker count is positive."""
+        if v <= 0:
+            raise ValueError('File processing workers must be positive')
+        return v
+    
     @field_validator('log_level')
     @classmethod
     def validate_log_level(cls, v):
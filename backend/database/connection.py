@@ -48,6 +48,8 @@ class DatabaseConnection:
     
     def _ensure_db_directory(self) -> None:
         """Ensure the database directory exists."""
+        if self.db_path.parent.exists():
+            return
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         logger.info(f"Database directory ensured: {self.db_path.parent}")
     
@@ -17,35 +17,56 @@ from datetime import datetime
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Default ChromaDB location: data/chroma/ under the project root
+_DEFAULT_PERSIST_DIRECTORY = Path(__file__).parent.parent.parent / "data" / "chroma"
+
 
 class VectorStore:
     """
     ChromaDB vector storage manager for semantic search and document embeddings.
     """
     
-    def __init__(self, persist_directory: Optional[str] = None):
+    def __init__(
+        self,
+        persist_directory: Optional[str] = None,
+        ephemeral: bool = False,
+        embedding_function: Optional[Any] = None
+    ):
         """
         Initialize ChromaDB vector store.
         
         Args:
             persist_directory: Directory to persist ChromaDB data. If None, uses default path.
+            ephemeral: Keep all data in memory instead of on disk; persist_directory
+                is ignored and nothing is written to the filesystem.
+            embedding_function: ChromaDB embedding function for every collection.
+                If None, ChromaDB's default embedding model is used.
         """
-        if persist_directory is None:
-            # Default to data/chroma/ directory
-            project_root = Path(__file__).parent.parent.parent
-            persist_directory = project_root / "data" / "chroma"
+        self.embedding_function = embedding_function
+        self._collection_kwargs = (
+            {} if embedding_function is None else {'embedding_function': embedding_function}
+        )
         
-        self.persist_directory = Path(persist_directory)
-        self._ensure_chroma_directory()
+        settings = Settings(
+            anonymized_telemetry=False,
+            allow_reset=True
+        )
         
-        # Initialize ChromaDB client
-        self.client = chromadb.PersistentClient(
-            path=str(self.persist_directory),
-            settings=Settings(
-                anonymized_telemetry=False,
-                allow_reset=True
+        if ephemeral:
+            self.persist_directory = None
+            self.client = chromadb.EphemeralClient(settings=settings)
+        else:
+            if persist_directory is None:
+                persist_directory = _DEFAULT_PERSIST_DIRECTORY
+            
+            self.persist_directory = Path(persist_directory)
+            self._ensure_chroma_directory()
+            
+            # Initialize ChromaDB client
+            self.client = chromadb.PersistentClient(
+                path=str(self.persist_directory),
+                settings=settings
             )
-        )
         
         # Collection names for different data types
         self.collections = {
@@ -55,7 +76,7 @@ class VectorStore:
             'skills_taxonomy': 'skills_taxonomy'
         }
         
-        logger.info(f"Vector store initialized: {self.persist_directory}")
+        logger.info(f"Vector store initialized: {self.persist_directory or 'in memory'}")
     
     def _ensure_chroma_directory(self) -> None:
         """Ensure the ChromaDB directory exists."""
@@ -74,7 +95,7 @@ class VectorStore:
             chromadb.Collection: ChromaDB collection object
         """
         try:
-            collection = self.client.get_collection(collection_name)
+            collection = self.client.get_collection(collection_name, **self._collection_kwargs)
             logger.debug(f"Retrieved existing collection: {collection_name}")
             return collection
         except Exception as e:
@@ -82,7 +103,8 @@ class VectorStore:
                 logger.info(f"Creating new collection: {collection_name}")
                 collection = self.client.create_collection(
                     name=collection_name,
-                    metadata={"description": f"Collection for {collection_name}"}
+                    metadata={"description": f"Collection for {collection_name}"},
+                    **self._collection_kwargs
                 )
                 return collection
             else:
@@ -373,15 +395,16 @@ class VectorStore:
         Returns:
             Dict containing vector store information
         """
+        ephemeral = self.persist_directory is None
         info = {
-            'persist_directory': str(self.persist_directory),
-            'directory_exists': self.persist_directory.exists(),
+            'persist_directory': None if ephemeral else str(self.persist_directory),
+            'directory_exists': not ephemeral and self.persist_directory.exists(),
             'collections': self.list_collections(),
             'total_collections': 0,
             'total_documents': 0
         }
         
-        if self.persist_directory.exists():
+        if ephemeral or info['directory_exists']:
             info['total_collections'] = len(info['collections'])
             info['total_documents'] = sum(
                 collection['document_count'] for collection in info['collections']
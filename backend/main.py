@@ -1,4 +1,5 @@
 from fastapi import FastAPI, HTTPException, UploadFile, File, Form
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
 import uvicorn
 import os
@@ -221,7 +222,7 @@ async def upload_multiple_files(files: List[UploadFile] = File(...)):
     """
     try:
         file_processor = get_file_processor()
-        processed_contents = file_processor.process_multiple_files(files)
+        processed_contents = await run_in_threadpool(file_processor.process_multiple_files, files)
         
         results = []
         for content in processed_contents:
@@ -8,6 +8,7 @@ and personalized learning experiences based on user skill gaps and context.
 import logging
 import json
 import uuid
+from collections import Counter
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timezone
 from dataclasses import dataclass
@@ -35,6 +36,27 @@ from .user_service import UserService
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Numeric rank of each skill/difficulty level
+_LEVEL_RANKS = {"beginner": 1, "intermediate": 2, "advanced": 3, "expert": 4}
+
+# Difficulties a learning path can be labelled with, by rank
+_PATH_DIFFICULTIES = ("beginner", "intermediate", "advanced")
+
+# Preferred content type for known skills
+_CONTENT_TYPE_BY_SKILL = {
+    "programming": "tutorial",
+    "data_analysis": "practical_exercise",
+    "user_research": "case_study",
+    "product_strategy": "concept_explanation",
+    "stakeholder_management": "case_study",
+    "api_development": "tutorial",
+    "database_design": "practical_exercise"
+}
+
+# Priority bonuses for content difficulty and hands-on content types
+_DIFFICULTY_PRIORITY_BONUS = {"intermediate": 3, "beginner": 2}
+_HANDS_ON_CONTENT_TYPES = frozenset({"tutorial", "practical_exercise"})
+
 
 @dataclass
 class LearningRecommendation:
@@ -448,18 +470,7 @@ class LearningEngine:
     
     def _select_content_type(self, skill_name: str, difficulty: str) -> str:
         """Select appropriate content type based on skill and difficulty."""
-        # Map skills to content types
-        content_type_mapping = {
-            "programming": "tutorial",
-            "data_analysis": "practical_exercise",
-            "user_research": "case_study",
-            "product_strategy": "concept_explanation",
-            "stakeholder_management": "case_study",
-            "api_development": "tutorial",
-            "database_design": "practical_exercise"
-        }
-        
-        return content_type_mapping.get(skill_name.lower(), "concept_explanation")
+        return _CONTENT_TYPE_BY_SKILL.get(skill_name.lower(), "concept_explanation")
     
     def _format_content_text(self, content_data: Dict[str, Any]) -> str:
         """Format content data into readable text."""
@@ -471,43 +482,32 @@ class LearningEngine:
         # Learning objectives
         if content_data.get('learning_objectives'):
             text_parts.append("## Learning Objectives")
-            for obj in content_data['learning_objectives']:
-                text_parts.append(f"- {obj}")
+            text_parts.extend(f"- {obj}" for obj in content_data['learning_objectives'])
             text_parts.append("")
         
         # Content structure
         if content_data.get('content_structure'):
             text_parts.append("## Content Structure")
-            for i, step in enumerate(content_data['content_structure'], 1):
-                text_parts.append(f"{i}. {step}")
+            text_parts.extend(f"{i}. {step}" for i, step in enumerate(content_data['content_structure'], 1))
             text_parts.append("")
         
         # Practical exercises
         if content_data.get('practical_exercises'):
             text_parts.append("## Practical Exercises")
-            for exercise in content_data['practical_exercises']:
-                text_parts.append(f"- {exercise}")
+            text_parts.extend(f"- {exercise}" for exercise in content_data['practical_exercises'])
             text_parts.append("")
         
         # Key takeaways
         if content_data.get('key_takeaways'):
             text_parts.append("## Key Takeaways")
-            for takeaway in content_data['key_takeaways']:
-                text_parts.append(f"- {takeaway}")
+            text_parts.extend(f"- {takeaway}" for takeaway in content_data['key_takeaways'])
         
         return "\n".join(text_parts)
     
     def _determine_difficulty_level(self, current_level: str, target_level: str) -> str:
         """Determine appropriate difficulty level based on skill levels."""
-        level_mapping = {
-            "beginner": 1,
-            "intermediate": 2,
-            "advanced": 3,
-            "expert": 4
-        }
-        
-        current_num = level_mapping.get(current_level.lower(), 1)
-        target_num = level_mapping.get(target_level.lower(), 2)
+        current_num = _LEVEL_RANKS.get(current_level.lower(), 1)
+        target_num = _LEVEL_RANKS.get(target_level.lower(), 2)
         
         if target_num - current_num >= 2:
             return "advanced"
@@ -523,10 +523,8 @@ class LearningEngine:
         user_profile: UserProfile
     ) -> float:
         """Calculate priority score for content recommendation."""
-        score = 0.0
-        
         # Base score from gap size
-        score += skill_gap.gap_size * 10
+        score = float(skill_gap.gap_size * 10)
         
         # Duration bonus (shorter is better for micro-learning)
         duration = content.get('estimated_duration', 15)
@@ -536,14 +534,10 @@ class LearningEngine:
             score += 3
         
         # Difficulty alignment
-        if content.get('difficulty') == 'intermediate':
-            score += 3
-        elif content.get('difficulty') == 'beginner':
-            score += 2
+        score += _DIFFICULTY_PRIORITY_BONUS.get(content.get('difficulty'), 0)
         
         # Content type bonus
-        content_type = content.get('content_type', '')
-        if content_type in ['tutorial', 'practical_exercise']:
+        if content.get('content_type', '') in _HANDS_ON_CONTENT_TYPES:
             score += 2
         
         return score
@@ -592,8 +586,7 @@ class LearningEngine:
     def _calculate_difficulty_distribution(self, recommendations: List[LearningRecommendation]) -> Dict[str, int]:
         """Calculate difficulty level distribution."""
         distribution = {"beginner": 0, "intermediate": 0, "advanced": 0, "expert": 0}
-        for rec in recommendations:
-            distribution[rec.difficulty] = distribution.get(rec.difficulty, 0) + 1
+        distribution.update(Counter(rec.difficulty for rec in recommendations))
         return distribution
     
     def _determine_overall_difficulty(self, recommendations: List[LearningRecommendation]) -> str:
@@ -601,15 +594,9 @@ class LearningEngine:
         if not recommendations:
             return "beginner"
         
-        difficulty_scores = {"beginner": 1, "intermediate": 2, "advanced": 3, "expert": 4}
-        avg_score = sum(difficulty_scores.get(rec.difficulty, 1) for rec in recommendations) / len(recommendations)
-        
-        if avg_score >= 3:
-            return "advanced"
-        elif avg_score >= 2:
-            return "intermediate"
-        else:
-            return "beginner"
+        # The hardest content sets the path difficulty, capped at advanced
+        top_rank = max(_LEVEL_RANKS.get(rec.difficulty, 1) for rec in recommendations)
+        return _PATH_DIFFICULTIES[min(top_rank, len(_PATH_DIFFICULTIES)) - 1]
     
     def _create_default_learning_path(self, user_id: str, user_profile: UserProfile) -> PersonalizedLearningPath:
         """Create a default learning path when no skill gaps are found."""
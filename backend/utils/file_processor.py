@@ -7,22 +7,30 @@ supporting multiple file formats and text extraction for skills assessment artif
 
 import os
 import io
+import csv
+import json
+import re
+import time
+import zipfile
 import mimetypes
 import hashlib
-from typing import Dict, List, Optional, Union, Any, Tuple
+import threading
+from typing import Dict, List, Optional, Union, Any, Tuple, Callable
+from types import MappingProxyType
 from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import logging
 
 # File processing imports
-import PyPDF2
-from docx import Document
+import pymupdf
 from pptx import Presentation
 import openpyxl
-import pandas as pd
-from bs4 import BeautifulSoup
-import markdown
-import json
+import pyarrow as pa
+from pyarrow import csv as pa_csv
+from lxml import etree
+from lxml import html as lxml_html
+import orjson
 
 # FastAPI imports for file handling
 from fastapi import UploadFile, HTTPException
@@ -32,6 +40,47 @@ from ..core.config import get_config
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Elements whose content is never user-visible text
+_HTML_NON_TEXT_XPATH = etree.XPath('//script|//style')
+
+# Document-level elements the HTML parser adds when the source omits them
+_HTML_IMPLIED_TAGS = frozenset(('html', 'head', 'body'))
+_HTML_IMPLIED_TAG_START = re.compile(rb'<(html|head|body)[\s/>]', re.IGNORECASE)
+
+# WordprocessingML tags for paragraphs and text runs in word/document.xml
+_DOCX_NAMESPACE = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+_DOCX_PARAGRAPH_TAG = f'{{{_DOCX_NAMESPACE}}}p'
+_DOCX_TEXT_TAG = f'{{{_DOCX_NAMESPACE}}}t'
+_DOCX_RUN_TAG = f'{{{_DOCX_NAMESPACE}}}r'
+
+# Run-level elements that stand for whitespace, as python-docx renders them
+# (w:tab also defines tab stops in paragraph properties, so only run children count)
+_DOCX_WHITESPACE_TAGS = {
+    f'{{{_DOCX_NAMESPACE}}}tab': '\t',
+    f'{{{_DOCX_NAMESPACE}}}br': '\n',
+    f'{{{_DOCX_NAMESPACE}}}cr': '\n',
+}
+
+# Code spans and backslash escapes, set aside so the strip patterns leave them intact
+_MARKDOWN_LITERAL_PATTERN = re.compile(r'`([^`\n]+)`|\\([\\`*_{}\[\]()#+\-.!<>|~])')
+_MARKDOWN_LITERAL_PLACEHOLDER = re.compile(r'\x00(\d+)\x00')
+
+# Markdown syntax to strip, applied in order; each keeps its first group (if any)
+_MARKDOWN_STRIP_PATTERNS = [
+    re.compile(r'^[ \t]*(?:```|~~~).*$', re.MULTILINE),         # code fences
+    re.compile(r'^[ \t]*(?:=+|-+)[ \t]*$', re.MULTILINE),       # setext underlines
+    re.compile(r'^[ \t]*#{1,6}[ \t]*', re.MULTILINE),           # headings
+    re.compile(r'^[ \t]*>[ \t]?', re.MULTILINE),                # blockquotes
+    re.compile(r'^[ \t]*(?:[-*+]|\d+\.)[ \t]+', re.MULTILINE),  # list markers
+    re.compile(r'<((?:https?|mailto):[^>\s]+)>'),               # autolinks
+    re.compile(r'<!--.*?-->', re.DOTALL),                       # HTML comments
+    re.compile(r'</?[A-Za-z][^>]*>'),                           # inline HTML tags
+    re.compile(r'!?\[([^\]]*)\]\([^)]*\)'),                     # links and images
+    re.compile(r'\*\*(?=\S)([^*]+?)(?<=\S)\*\*'),               # bold
+    re.compile(r'__(?=\S)([^_]+?)(?<=\S)__'),                   # bold
+    re.compile(r'(?<!\*)\*(?=\S)([^*\n]+?)(?<=\S)\*'),          # italic
+]
+
 
 @dataclass
 class FileMetadata:
@@ -64,8 +113,8 @@ class FileProcessor:
     with text extraction and metadata generation.
     """
     
-    # Supported file types and their extensions
-    SUPPORTED_EXTENSIONS = {
+    # Supported file types and their extensions (read-only)
+    SUPPORTED_EXTENSIONS = MappingProxyType({
         '.pdf': 'application/pdf',
         '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
         '.doc': 'application/msword',
@@ -79,7 +128,24 @@ class FileProcessor:
         '.md': 'text/markdown',
         '.json': 'application/json',
         '.csv': 'text/csv'
-    }
+    })
+    
+    # Extractor method name for each supported extension (read-only)
+    _EXTRACTORS = MappingProxyType({
+        '.pdf': 'extract_text_from_pdf',
+        '.docx': 'extract_text_from_docx',
+        '.doc': 'extract_text_from_docx',
+        '.pptx': 'extract_text_from_pptx',
+        '.ppt': 'extract_text_from_pptx',
+        '.xlsx': 'extract_text_from_xlsx',
+        '.xls': 'extract_text_from_xlsx',
+        '.txt': 'extract_text_from_txt',
+        '.html': 'extract_text_from_html',
+        '.htm': 'extract_text_from_html',
+        '.md': 'extract_text_from_markdown',
+        '.json': 'extract_text_from_json',
+        '.csv': 'extract_text_from_csv'
+    })
     
     # Maximum file size (10MB)
     MAX_FILE_SIZE = 10 * 1024 * 1024
@@ -100,6 +166,32 @@ class FileProcessor:
         
         logger.info(f"File processor initialized with upload directory: {self.upload_dir}")
     
+    @classmethod
+    def register_extractor(cls, extension: str, mime_type: str) -> Callable:
+        """
+        Decorator registering a text extractor for an additional file extension.
+        
+        The decorated function becomes a method of FileProcessor and must take
+        the file content as bytes and return a (text, count) tuple.
+        
+        Args:
+            extension: File extension including the leading dot, e.g. '.log'
+            mime_type: Expected MIME type for the extension
+            
+        Returns:
+            Decorator that registers and returns the extractor function
+        """
+        extension = extension.lower()
+        
+        def decorator(func: Callable) -> Callable:
+            setattr(cls, func.__name__, func)
+            cls._EXTRACTORS = MappingProxyType({**cls._EXTRACTORS, extension: func.__name__})
+            cls.SUPPORTED_EXTENSIONS = MappingProxyType({**cls.SUPPORTED_EXTENSIONS, extension: mime_type})
+            logger.info(f"Registered extractor {func.__name__} for {extension} files")
+            return func
+        
+        return decorator
+    
     def validate_file(self, file: UploadFile) -> Tuple[bool, str]:
         """
         Validate uploaded file.
@@ -119,7 +211,7 @@ class FileProcessor:
             if not file.filename:
                 return False, "No filename provided"
             
-            file_ext = Path(file.filename).suffix.lower()
+            file_ext = self._get_file_extension(file.filename)
             if file_ext not in self.SUPPORTED_EXTENSIONS:
                 return False, f"Unsupported file type: {file_ext}. Supported types: {', '.join(self.SUPPORTED_EXTENSIONS.keys())}"
             
@@ -135,17 +227,36 @@ class FileProcessor:
             logger.error(f"File validation error: {e}")
             return False, f"File validation failed: {str(e)}"
     
+    @staticmethod
+    def _get_file_extension(filename: str) -> str:
+        """
+        Get the lowercased extension of a filename.
+        
+        Uses plain string splitting rather than building a Path object.
+        
+        Args:
+            filename: Uploaded file name
+            
+        Returns:
+            Extension including the leading dot, or an empty string
+        """
+        return os.path.splitext(filename)[1].lower()
+    
     def calculate_file_hash(self, content: bytes) -> str:
         """
         Calculate SHA-256 hash of file content.
         
+        The hash is only used for content deduplication, so it is flagged as
+        non-security use; this keeps it allowed on FIPS-restricted builds and
+        has no effect on speed.
+        
         Args:
             content: File content as bytes
             
         Returns:
             SHA-256 hash string
         """
-        return hashlib.sha256(content).hexdigest()
+        return hashlib.sha256(content, usedforsecurity=False).hexdigest()
     
     def extract_text_from_pdf(self, content: bytes) -> Tuple[str, int]:
         """
@@ -158,21 +269,19 @@ class FileProcessor:
             Tuple of (extracted_text, page_count)
         """
         try:
-            pdf_file = io.BytesIO(content)
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
+            text_parts = []
             
-            text = ""
-            page_count = len(pdf_reader.pages)
-            
-            for page_num in range(page_count):
-                try:
-                    page = pdf_reader.pages[page_num]
-                    text += page.extract_text() + "\n"
-                except Exception as e:
-                    logger.warning(f"Error extracting text from page {page_num + 1}: {e}")
-                    continue
+            with pymupdf.open(stream=content, filetype="pdf") as pdf_document:
+                page_count = pdf_document.page_count
+                
+                for page_num, page in enumerate(pdf_document):
+                    try:
+                        text_parts.append(page.get_text("text"))
+                    except Exception as e:
+                        logger.warning(f"Error extracting text from page {page_num + 1}: {e}")
+                        continue
             
-            return text.strip(), page_count
+            return "\n".join(text_parts).strip(), page_count
             
         except Exception as e:
             logger.error(f"PDF text extraction failed: {e}")
@@ -189,12 +298,33 @@ class FileProcessor:
             Tuple of (extracted_text, page_count)
         """
         try:
-            doc_file = io.BytesIO(content)
-            doc = Document(doc_file)
-            
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
+            paragraphs = []
+            runs = []
+            
+            # Stream word/document.xml rather than loading the full document model
+            with zipfile.ZipFile(io.BytesIO(content)) as docx_zip, \
+                    docx_zip.open('word/document.xml') as document_xml:
+                for _, element in etree.iterparse(
+                    document_xml, tag=(_DOCX_PARAGRAPH_TAG, _DOCX_TEXT_TAG, *_DOCX_WHITESPACE_TAGS)
+                ):
+                    if element.tag == _DOCX_TEXT_TAG:
+                        if element.text:
+                            runs.append(element.text)
+                        continue
+                    if element.tag in _DOCX_WHITESPACE_TAGS:
+                        if element.getparent().tag == _DOCX_RUN_TAG:
+                            runs.append(_DOCX_WHITESPACE_TAGS[element.tag])
+                        continue
+                    
+                    paragraphs.append("".join(runs))
+                    runs = []
+                    
+                    # Drop parsed paragraphs so memory stays flat for large documents
+                    element.clear()
+                    while element.getprevious() is not None:
+                        del element.getparent()[0]
+            
+            text = "\n".join(paragraphs)
             
             # Estimate page count (rough approximation)
             page_count = max(1, len(text) // 2000)  # ~2000 characters per page
@@ -245,22 +375,29 @@ class FileProcessor:
         """
         try:
             xlsx_file = io.BytesIO(content)
-            workbook = openpyxl.load_workbook(xlsx_file, data_only=True)
-            
-            text = ""
-            sheet_count = len(workbook.sheetnames)
+            # Stream rows instead of building the full cell/style object model
+            workbook = openpyxl.load_workbook(
+                xlsx_file, read_only=True, data_only=True, keep_links=False
+            )
             
-            for sheet_name in workbook.sheetnames:
-                sheet = workbook[sheet_name]
-                text += f"Sheet: {sheet_name}\n"
+            try:
+                text_parts = []
+                sheet_count = len(workbook.sheetnames)
                 
-                for row in sheet.iter_rows(values_only=True):
-                    row_text = " | ".join(str(cell) if cell is not None else "" for cell in row)
-                    if row_text.strip():
-                        text += row_text + "\n"
-                text += "\n"
-            
-            return text.strip(), sheet_count
+                for sheet_name in workbook.sheetnames:
+                    sheet = workbook[sheet_name]
+                    text_parts.append(f"Sheet: {sheet_name}")
+                    
+                    for row in sheet.iter_rows(values_only=True):
+                        row_text = " | ".join(str(cell) if cell is not None else "" for cell in row)
+                        if row_text.strip():
+                            text_parts.append(row_text)
+                    text_parts.append("")
+            finally:
+                # Read-only workbooks keep the underlying zip file open
+                workbook.close()
+            
+            return "\n".join(text_parts).strip(), sheet_count
             
         except Exception as e:
             logger.error(f"XLSX text extraction failed: {e}")
@@ -310,25 +447,42 @@ class FileProcessor:
             Tuple of (extracted_text, element_count)
         """
         try:
-            # Decode HTML content
-            html_text = content.decode('utf-8', errors='replace')
+            if not content.strip():
+                return "", 0
             
-            # Parse HTML and extract text
-            soup = BeautifulSoup(html_text, 'html.parser')
+            # Parse the raw bytes so the parser honours any declared encoding
+            try:
+                root = lxml_html.document_fromstring(content)
+            except etree.ParserError:
+                # Nothing but whitespace or comments
+                return "", 0
             
-            # Remove script and style elements
-            for script in soup(["script", "style"]):
-                script.decompose()
+            # Remove script and style elements, keeping any text that follows them
+            for element in _HTML_NON_TEXT_XPATH(root):
+                element.drop_tree()
             
             # Get text content
-            text = soup.get_text()
+            text = root.text_content()
             
             # Clean up whitespace
             lines = (line.strip() for line in text.splitlines())
             chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
             text = ' '.join(chunk for chunk in chunks if chunk)
             
-            element_count = len(soup.find_all())
+            # Count only elements present in the source: a wrapper the parser
+            # implied has no start tag on the line it is attributed to
+            source_lines = content.splitlines()
+            
+            def in_source(element) -> bool:
+                if element.tag not in _HTML_IMPLIED_TAGS:
+                    return True
+                line_index = (element.sourceline or 0) - 1
+                if not 0 <= line_index < len(source_lines):
+                    return False
+                tags = _HTML_IMPLIED_TAG_START.findall(source_lines[line_index])
+                return element.tag in (tag.lower().decode() for tag in tags)
+            
+            element_count = sum(1 for element in root.iter(etree.Element) if in_source(element))
             
             return text.strip(), element_count
             
@@ -350,12 +504,20 @@ class FileProcessor:
             # Decode markdown content
             md_text = content.decode('utf-8', errors='replace')
             
-            # Convert markdown to HTML then extract text
-            html = markdown.markdown(md_text)
-            soup = BeautifulSoup(html, 'html.parser')
+            # Set code spans and escaped characters aside as placeholders
+            literals = []
+            
+            def stash_literal(match):
+                literals.append(match.group(1) if match.group(1) is not None else match.group(2))
+                return f"\x00{len(literals) - 1}\x00"
             
-            # Extract text content
-            text = soup.get_text()
+            text = _MARKDOWN_LITERAL_PATTERN.sub(stash_literal, md_text)
+            
+            # Strip markdown syntax directly; formatting is discarded anyway
+            for pattern in _MARKDOWN_STRIP_PATTERNS:
+                text = pattern.sub(lambda match: match.group(1) if match.groups() else '', text)
+            
+            text = _MARKDOWN_LITERAL_PLACEHOLDER.sub(lambda match: literals[int(match.group(1))], text)
             
             # Clean up whitespace
             lines = (line.strip() for line in text.splitlines())
@@ -381,11 +543,12 @@ class FileProcessor:
             Tuple of (extracted_text, object_count)
         """
         try:
-            # Decode JSON content
-            json_text = content.decode('utf-8', errors='replace')
-            
-            # Parse JSON
-            data = json.loads(json_text)
+            # Parse JSON straight from the raw bytes; the stdlib parser still
+            # accepts what orjson rejects (invalid UTF-8, NaN, big integers)
+            try:
+                data = orjson.loads(content)
+            except orjson.JSONDecodeError:
+                data = json.loads(content.decode('utf-8', errors='replace'))
             
             # Extract text from JSON structure
             def extract_text_from_dict(obj, path=""):
@@ -411,8 +574,17 @@ class FileProcessor:
             text_parts = extract_text_from_dict(data)
             text = "\n".join(text_parts)
             
-            # Count objects (rough approximation)
-            object_count = len(str(data).split(','))
+            # Count scalar values without recursing or re-serializing
+            object_count = 0
+            stack = [data]
+            while stack:
+                obj = stack.pop()
+                if isinstance(obj, dict):
+                    stack.extend(obj.values())
+                elif isinstance(obj, list):
+                    stack.extend(obj)
+                else:
+                    object_count += 1
             
             return text.strip(), object_count
             
@@ -431,17 +603,29 @@ class FileProcessor:
             Tuple of (extracted_text, row_count)
         """
         try:
-            # Decode CSV content
-            csv_text = content.decode('utf-8', errors='replace')
+            # Replace invalid UTF-8 up front; Arrow would read such columns as binary
+            csv_bytes = content.decode('utf-8', errors='replace').encode('utf-8')
             
-            # Read CSV with pandas
-            csv_file = io.StringIO(csv_text)
-            df = pd.read_csv(csv_file)
-            
-            # Convert to text representation
-            text = df.to_string(index=False)
-            
-            row_count = len(df)
+            try:
+                # Read CSV into a columnar Arrow table
+                table = pa_csv.read_csv(io.BytesIO(csv_bytes))
+            except pa.ArrowInvalid:
+                # Arrow rejects ragged rows; read row by row, padding short rows
+                reader = csv.reader(io.StringIO(csv_bytes.decode('utf-8')))
+                header = next(reader, [])
+                rows = [row + [""] * (len(header) - len(row)) for row in reader if row]
+                lines = [" | ".join(header)]
+                lines.extend(" | ".join(row) for row in rows)
+                return "\n".join(lines).strip(), len(rows)
+            
+            # Convert to text representation, one line per row
+            lines = [" | ".join(table.column_names)]
+            columns = [column.to_pylist() for column in table.columns]
+            for row in zip(*columns):
+                lines.append(" | ".join(str(cell) if cell is not None else "" for cell in row))
+            text = "\n".join(lines)
+            
+            row_count = table.num_rows
             
             return text.strip(), row_count
             
@@ -462,7 +646,6 @@ class FileProcessor:
         Raises:
             HTTPException: If file processing fails
         """
-        import time
         start_time = time.time()
         
         try:
@@ -473,122 +656,139 @@ class FileProcessor:
             
             # Read file content
             content = file.file.read()
-            file_size = len(content)
             
-            # Calculate file hash
-            file_hash = self.calculate_file_hash(content)
-            
-            # Determine file type
-            file_ext = Path(file.filename).suffix.lower()
-            mime_type = self.SUPPORTED_EXTENSIONS.get(file_ext, 'application/octet-stream')
-            
-            # Extract text based on file type
-            text = ""
-            page_count = None
-            
-            if file_ext == '.pdf':
-                text, page_count = self.extract_text_from_pdf(content)
-            elif file_ext in ['.docx', '.doc']:
-                text, page_count = self.extract_text_from_docx(content)
-            elif file_ext in ['.pptx', '.ppt']:
-                text, page_count = self.extract_text_from_pptx(content)
-            elif file_ext in ['.xlsx', '.xls']:
-                text, page_count = self.extract_text_from_xlsx(content)
-            elif file_ext == '.txt':
-                text, page_count = self.extract_text_from_txt(content)
-            elif file_ext in ['.html', '.htm']:
-                text, page_count = self.extract_text_from_html(content)
-            elif file_ext == '.md':
-                text, page_count = self.extract_text_from_markdown(content)
-            elif file_ext == '.json':
-                text, page_count = self.extract_text_from_json(content)
-            elif file_ext == '.csv':
-                text, page_count = self.extract_text_from_csv(content)
-            else:
-                raise HTTPException(status_code=400, detail=f"Unsupported file type: {file_ext}")
-            
-            # Create metadata
-            processing_time = time.time() - start_time
-            metadata = FileMetadata(
-                filename=file.filename,
-                file_size=file_size,
-                file_type=file_ext,
-                mime_type=mime_type,
-                file_hash=file_hash,
-                processing_time=processing_time,
-                text_length=len(text),
-                page_count=page_count
-            )
-            
-            # Create processed content
-            processed_content = ProcessedContent(
-                text=text,
-                metadata=metadata
-            )
-            
-            logger.info(f"Successfully processed file: {file.filename} ({file_size} bytes, {len(text)} chars)")
-            
-            return processed_content
+            return self._process_content(file.filename, content, start_time)
             
         except HTTPException:
             raise
         except Exception as e:
             logger.error(f"File processing failed for {file.filename}: {e}")
-            processing_time = time.time() - start_time
-            
-            # Create error metadata
-            metadata = FileMetadata(
-                filename=file.filename,
-                file_size=0,
-                file_type=Path(file.filename).suffix.lower() if file.filename else "",
-                mime_type="",
-                file_hash="",
-                processing_time=processing_time,
-                text_length=0,
-                error=str(e)
-            )
             
             raise HTTPException(
                 status_code=500, 
                 detail=f"File processing failed: {str(e)}"
             )
     
-    def process_multiple_files(self, files: List[UploadFile]) -> List[ProcessedContent]:
+    def _process_content(self, filename: str, content: bytes, start_time: float) -> ProcessedContent:
+        """
+        Hash and extract text from already-read file content.
+        
+        Args:
+            filename: Original filename, used to pick the extractor
+            content: File content as bytes
+            start_time: Time processing started, for metadata
+            
+        Returns:
+            ProcessedContent: Extracted text and metadata
+        """
+        file_size = len(content)
+        
+        # Calculate file hash
+        file_hash = self.calculate_file_hash(content)
+        
+        # Determine file type
+        file_ext = self._get_file_extension(filename)
+        mime_type = self.SUPPORTED_EXTENSIONS.get(file_ext, 'application/octet-stream')
+        
+        # Extract text based on file type
+        extractor_name = self._EXTRACTORS.get(file_ext)
+        if extractor_name is None:
+            raise ValueError(f"Unsupported file type: {file_ext}")
+        text, page_count = getattr(self, extractor_name)(content)
+        
+        # Create metadata
+        processing_time = time.time() - start_time
+        metadata = FileMetadata(
+            filename=filename,
+            file_size=file_size,
+            file_type=file_ext,
+            mime_type=mime_type,
+            file_hash=file_hash,
+            processing_time=processing_time,
+            text_length=len(text),
+            page_count=page_count
+        )
+        
+        logger.info(f"Successfully processed file: {filename} ({file_size} bytes, {len(text)} chars)")
+        
+        return ProcessedContent(
+            text=text,
+            metadata=metadata
+        )
+    
+    def process_multiple_files(self, files: List[UploadFile], max_workers: Optional[int] = None) -> List[ProcessedContent]:
         """
         Process multiple files in batch.
         
+        With more than one worker, hashing and text extraction run in a
+        shared process pool of that size, kept for later batches; files
+        are still validated and read in this process.
+        
         Args:
             files: List of FastAPI UploadFile objects
+            max_workers: Number of worker processes. Defaults to the
+                file_processing_workers setting; 1 processes files
+                serially in this process.
             
         Returns:
             List of ProcessedContent objects
         """
-        results = []
+        if max_workers is None:
+            max_workers = self.settings.file_processing_workers
+        
+        if max_workers <= 1 or len(files) <= 1:
+            results = []
+            for file in files:
+                try:
+                    results.append(self.process_file(file))
+                except Exception as e:
+                    logger.error(f"Failed to process file {file.filename}: {e}")
+                    results.append(self._error_result(file.filename, e))
+            return results
+        
+        executor = _get_process_pool(max_workers)
+        results: List[Optional[ProcessedContent]] = [None] * len(files)
+        futures = {}
         
-        for file in files:
+        for index, file in enumerate(files):
             try:
-                processed_content = self.process_file(file)
-                results.append(processed_content)
+                is_valid, error_msg = self.validate_file(file)
+                if not is_valid:
+                    raise HTTPException(status_code=400, detail=error_msg)
+                content = file.file.read()
             except Exception as e:
                 logger.error(f"Failed to process file {file.filename}: {e}")
-                # Create error result
-                metadata = FileMetadata(
-                    filename=file.filename,
-                    file_size=0,
-                    file_type="",
-                    mime_type="",
-                    file_hash="",
-                    processing_time=0,
-                    text_length=0,
-                    error=str(e)
-                )
-                results.append(ProcessedContent(
-                    text="",
-                    metadata=metadata
-                ))
+                results[index] = self._error_result(file.filename, e)
+                continue
+            
+            futures[index] = executor.submit(_process_content_in_worker, self, file.filename, content)
+        
+        for index, future in futures.items():
+            try:
+                results[index] = future.result()
+            except Exception as e:
+                logger.error(f"Failed to process file {files[index].filename}: {e}")
+                results[index] = self._error_result(files[index].filename, e)
         
         return results
     
+    def _error_result(self, filename: str, error: Exception) -> ProcessedContent:
+        """Build an empty ProcessedContent recording a processing error."""
+        metadata = FileMetadata(
+            filename=filename,
+            file_size=0,
+            file_type="",
+            mime_type="",
+            file_hash="",
+            processing_time=0,
+            text_length=0,
+            error=str(error)
+        )
+        return ProcessedContent(
+            text="",
+            metadata=metadata
+        )
+    
     def get_supported_formats(self) -> Dict[str, str]:
         """
         Get list of supported file formats.
@@ -613,6 +813,32 @@ class FileProcessor:
         }
 
 
+def _process_content_in_worker(processor: FileProcessor, filename: str, content: bytes) -> ProcessedContent:
+    """Process file content in a worker process (see process_multiple_files)."""
+    return processor._process_content(filename, content, time.time())
+
+
+# Shared process pools for parallel batch processing, keyed by worker count
+_process_pools: Dict[int, ProcessPoolExecutor] = {}
+_process_pools_lock = threading.Lock()
+
+
+def _get_process_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Get the shared process pool with max_workers workers, creating it on first use."""
+    with _process_pools_lock:
+        if max_workers not in _process_pools:
+            _process_pools[max_workers] = ProcessPoolExecutor(max_workers=max_workers)
+        return _process_pools[max_workers]
+
+
+def shutdown_process_pool() -> None:
+    """Shut down the shared process pools, if any were started."""
+    with _process_pools_lock:
+        for pool in _process_pools.values():
+            pool.shutdown()
+        _process_pools.clear()
+
+
 # Global file processor instance
 _file_processor: Optional[FileProcessor] = None
 
@@ -649,3 +875,4 @@ def reset_file_processor() -> None:
     """Reset the global file processor instance (useful for testing)."""
     global _file_processor
     _file_processor = None
+    shutdown_process_pool()
@@ -51,9 +51,15 @@ API_ENDPOINTS = {
 class APIClient:
     """API client for communicating with the backend."""
     
+    __slots__ = ("base_url", "session_token", "session")
+    
+    _BASE_HEADERS = {"Content-Type": "application/json"}
+    
     def __init__(self):
-        self.base_url = API_BASE_URL
-        self.session_token = None
+        self.base_url: str = API_BASE_URL
+        self.session_token: Optional[str] = None
+        # Reuse pooled connections to the backend across requests
+        self.session: requests.Session = requests.Session()
     
     def set_session_token(self, token: str):
         """Set the session token for authenticated requests."""
@@ -61,29 +67,29 @@ class APIClient:
     
     def get_headers(self) -> Dict[str, str]:
         """Get headers for API requests."""
-        headers = {"Content-Type": "application/json"}
         if self.session_token:
-            headers["Authorization"] = f"Bearer {self.session_token}"
-        return headers
+            return {**self._BASE_HEADERS, "Authorization": f"Bearer {self.session_token}"}
+        return self._BASE_HEADERS.copy()
     
     def make_request(self, method: str, url: str, data: Optional[Dict] = None, files: Optional[Dict] = None) -> Dict[str, Any]:
         """Make an API request."""
         try:
             headers = self.get_headers()
+            method = method.upper()
             
-            if method.upper() == "GET":
-                response = requests.get(url, headers=headers)
-            elif method.upper() == "POST":
+            if method == "GET":
+                response = self.session.request("GET", url, headers=headers)
+            elif method == "POST":
                 if files:
                     # Remove Content-Type header for file uploads
                     headers.pop("Content-Type", None)
-                    response = requests.post(url, data=data, files=files, headers=headers)
+                    response = self.session.request("POST", url, data=data, files=files, headers=headers)
                 else:
-                    response = requests.post(url, json=data, headers=headers)
-            elif method.upper() == "PUT":
-                response = requests.put(url, json=data, headers=headers)
-            elif method.upper() == "DELETE":
-                response = requests.delete(url, headers=headers)
+                    response = self.session.request("POST", url, json=data, headers=headers)
+            elif method == "PUT":
+                response = self.session.request("PUT", url, json=data, headers=headers)
+            elif method == "DELETE":
+                response = self.session.request("DELETE", url, headers=headers)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
             
@@ -123,25 +129,32 @@ def initialize_session_state():
 
 def check_authentication():
     """Check if user is authenticated."""
-    if st.session_state.authenticated and st.session_state.session_token:
-        # Verify session is still valid
-        api_client = st.session_state.api_client
-        api_client.set_session_token(st.session_state.session_token)
-        
-        response = api_client.make_request("GET", API_ENDPOINTS["auth"]["me"])
-        if "error" in response:
-            # Session expired or invalid
+    if not st.session_state.session_token:
+        # Nothing to verify; an authenticated flag without a token is stale
+        if st.session_state.authenticated:
             st.session_state.authenticated = False
-            st.session_state.user_info = None
-            st.session_state.session_token = None
             st.session_state.current_page = "login"
-            st.error("Session expired. Please login again.")
-            return False
-        
-        st.session_state.user_info = response
-        return True
+        return False
+    
+    if not st.session_state.authenticated:
+        return False
+    
+    # Verify session is still valid
+    api_client = st.session_state.api_client
+    api_client.set_session_token(st.session_state.session_token)
+    
+    response = api_client.make_request("GET", API_ENDPOINTS["auth"]["me"])
+    if "error" in response:
+        # Session expired or invalid
+        st.session_state.authenticated = False
+        st.session_state.user_info = None
+        st.session_state.session_token = None
+        st.session_state.current_page = "login"
+        st.error("Session expired. Please login again.")
+        return False
     
-    return False
+    st.session_state.user_info = response
+    return True
 
 
 def show_login_page():
@@ -330,7 +343,7 @@ def show_sidebar():
         
         # Check API connection
         try:
-            response = requests.get(f"{API_BASE_URL}/health", timeout=5)
+            response = st.session_state.api_client.session.get(f"{API_BASE_URL}/health", timeout=5)
             if response.status_code == 200:
                 st.sidebar.success("🟢 API Connected")
             else:
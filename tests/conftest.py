@@ -0,0 +1,125 @@
+"""
+Shared pytest fixtures for the Personal Learning Agent test suite.
+"""
+
+import logging
+import sys
+import zlib
+from pathlib import Path
+
+import pytest
+from chromadb.api.types import Documents, EmbeddingFunction, Embeddings
+
+from backend.database.connection import DatabaseConnection
+from backend.database.vector_store import VectorStore
+
+# Make the Streamlit frontend importable as the top-level ``app`` module
+FRONTEND_DIR = Path(__file__).resolve().parent.parent / "frontend"
+if str(FRONTEND_DIR) not in sys.path:
+    sys.path.insert(0, str(FRONTEND_DIR))
+
+# Per-request INFO loggers; warnings and errors still reach failure reports
+QUIET_LOGGERS = ("backend", "httpx", "uvicorn", "uvicorn.access", "fastapi")
+
+
+def pytest_configure(config):
+    """Register markers used to select and schedule tests and quiet noisy loggers."""
+    for name in QUIET_LOGGERS:
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run grouped tests on the same worker under -n auto --dist loadgroup"
+    )
+    config.addinivalue_line(
+        "markers", "slow: Streamlit-heavy or bulk-data tests; deselect with -m 'not slow'"
+    )
+
+
+@pytest.fixture
+def db_with_tmp(tmp_path):
+    """Provide a DatabaseConnection backed by a per-test temporary file."""
+    yield DatabaseConnection(str(tmp_path / "test.db"))
+
+
+class HashEmbeddingFunction(EmbeddingFunction[Documents]):
+    """
+    Deterministic bag-of-words embedding for tests.
+
+    Hashes each token into a small fixed-size vector, so documents that
+    share words land close together without loading an embedding model.
+    """
+
+    DIMENSIONS = 16
+
+    def __init__(self):
+        pass
+
+    def __call__(self, input: Documents) -> Embeddings:
+        embeddings = []
+        for document in input:
+            vector = [0.0] * self.DIMENSIONS
+            for token in document.lower().split():
+                vector[zlib.crc32(token.encode()) % self.DIMENSIONS] += 1.0
+            embeddings.append(vector)
+        return embeddings
+
+    @staticmethod
+    def name():
+        return "test_hash"
+
+    def get_config(self):
+        return {}
+
+    @staticmethod
+    def build_from_config(config):
+        return HashEmbeddingFunction()
+
+
+@pytest.fixture(scope="session")
+def embedding_function():
+    """Provide the offline test embedding function."""
+    return HashEmbeddingFunction()
+
+
+@pytest.fixture(scope="session")
+def vector_store(embedding_function):
+    """
+    Share one in-memory VectorStore across the test session.
+
+    Opening a Chroma client is the expensive part of these tests, so it is
+    paid once, and nothing touches the disk or the network; tests keep
+    apart by using their own collection names.
+    """
+    return VectorStore(ephemeral=True, embedding_function=embedding_function)
+
+
+@pytest.fixture(scope="session")
+def app():
+    """Import the FastAPI backend app once per test session."""
+    from backend.main import app
+    return app
+
+
+@pytest.fixture
+def override_dependency(app):
+    """
+    Override FastAPI dependencies on the backend app for one test.
+
+    Call it with a dependency and the object to inject; the override is
+    returned, and every override is cleared again on teardown.
+    """
+
+    def override(dependency, value):
+        app.dependency_overrides[dependency] = lambda: value
+        return value
+
+    yield override
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture(scope="session")
+def app_module():
+    """Import the Streamlit frontend once per test session."""
+    pytest.importorskip("streamlit")
+    import app
+    return app
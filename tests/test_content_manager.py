@@ -11,6 +11,7 @@ from datetime import datetime, timezone
 from unittest.mock import Mock, patch, MagicMock
 
 # Import the modules to test
+from backend.utils import content_manager as content_manager_module
 from backend.utils.content_manager import (
     ContentManager,
     ContentMetadata,
@@ -565,6 +566,14 @@ class TestContentManager:
 class TestGlobalFunctions:
     """Test global utility functions."""
     
+    @pytest.fixture(autouse=True)
+    def isolated_storage(self, monkeypatch, db_with_tmp, vector_store):
+        """Build real managers on a temporary database and the in-memory vector store."""
+        monkeypatch.setattr(content_manager_module, 'get_database', lambda: db_with_tmp)
+        monkeypatch.setattr(content_manager_module, 'get_vector_store', lambda: vector_store)
+        yield
+        reset_content_manager()
+    
     def test_get_content_manager(self):
         """Test getting global content manager instance."""
         # Reset global instance
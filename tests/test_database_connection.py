@@ -7,10 +7,8 @@ including connection management, query execution, and error handling.
 
 import pytest
 import sqlite3
-import tempfile
-import os
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 from backend.database.connection import (
     DatabaseConnection, 
@@ -20,27 +18,18 @@ from backend.database.connection import (
 )
 
 
+def _failing_connect(*args, **kwargs):
+    """Stand-in for sqlite3.connect that always fails."""
+    raise sqlite3.Error("Connection failed")
+
+
 class TestDatabaseConnection:
     """Test cases for DatabaseConnection class."""
     
-    def setup_method(self):
-        """Set up test fixtures before each test method."""
-        # Create a temporary database file for testing
-        self.temp_dir = tempfile.mkdtemp()
-        self.test_db_path = os.path.join(self.temp_dir, "test.db")
-        self.db = DatabaseConnection(self.test_db_path)
-    
-    def teardown_method(self):
-        """Clean up after each test method."""
-        # Remove temporary database file
-        if os.path.exists(self.test_db_path):
-            os.remove(self.test_db_path)
-        os.rmdir(self.temp_dir)
-    
-    def test_initialization_with_custom_path(self):
+    def test_initialization_with_custom_path(self, db_with_tmp, tmp_path):
         """Test database initialization with custom path."""
-        assert self.db.db_path == Path(self.test_db_path)
-        assert self.db.db_path.parent.exists()
+        assert db_with_tmp.db_path == tmp_path / "test.db"
+        assert db_with_tmp.db_path.parent.exists()
     
     def test_initialization_with_default_path(self):
         """Test database initialization with default path."""
@@ -49,22 +38,22 @@ class TestDatabaseConnection:
         assert db.db_path == expected_path
         assert db.db_path.parent.exists()
     
-    def test_ensure_db_directory_creation(self):
+    def test_ensure_db_directory_creation(self, tmp_path):
         """Test that database directory is created if it doesn't exist."""
-        temp_dir = tempfile.mkdtemp()
-        db_path = os.path.join(temp_dir, "nested", "dir", "test.db")
+        db_path = tmp_path / "nested" / "dir" / "test.db"
         
-        try:
-            db = DatabaseConnection(db_path)
-            assert Path(db_path).parent.exists()
-        finally:
-            # Clean up
-            import shutil
-            shutil.rmtree(temp_dir)
+        DatabaseConnection(str(db_path))
+        assert db_path.parent.exists()
+    
+    def test_ensure_db_directory_skips_when_exists(self, tmp_path):
+        """Test that an existing database directory is not re-created."""
+        with patch.object(Path, 'mkdir') as mock_mkdir:
+            DatabaseConnection(str(tmp_path / "test.db"))
+            mock_mkdir.assert_not_called()
     
-    def test_connection_context_manager(self):
+    def test_connection_context_manager(self, db_with_tmp):
         """Test database connection context manager."""
-        with self.db.get_connection() as conn:
+        with db_with_tmp.get_connection() as conn:
             assert isinstance(conn, sqlite3.Connection)
             assert conn.row_factory == sqlite3.Row
         
@@ -72,9 +61,9 @@ class TestDatabaseConnection:
         with pytest.raises(sqlite3.ProgrammingError):
             conn.execute("SELECT 1")
     
-    def test_cursor_context_manager(self):
+    def test_cursor_context_manager(self, db_with_tmp):
         """Test database cursor context manager."""
-        with self.db.get_cursor() as cursor:
+        with db_with_tmp.get_cursor() as cursor:
             assert isinstance(cursor, sqlite3.Cursor)
             cursor.execute("SELECT 1 as test")
             result = cursor.fetchone()
@@ -84,137 +73,140 @@ class TestDatabaseConnection:
         with pytest.raises(sqlite3.ProgrammingError):
             cursor.execute("SELECT 1")
     
-    def test_execute_query_success(self):
+    def test_execute_query_success(self, db_with_tmp):
         """Test successful query execution."""
         # Create a test table
-        with self.db.get_connection() as conn:
-            conn.execute("CREATE TABLE test (id INTEGER, name TEXT)")
-            conn.execute("INSERT INTO test VALUES (1, 'test1'), (2, 'test2')")
-            conn.commit()
+        with db_with_tmp.get_connection() as conn:
+            conn.executescript(
+                "CREATE TABLE test (id INTEGER, name TEXT);"
+                "INSERT INTO test VALUES (1, 'test1'), (2, 'test2');"
+            )
         
         # Test query execution
-        results = self.db.execute_query("SELECT * FROM test ORDER BY id")
+        results = db_with_tmp.execute_query("SELECT * FROM test ORDER BY id")
         assert len(results) == 2
         assert results[0]['id'] == 1
         assert results[0]['name'] == 'test1'
         assert results[1]['id'] == 2
         assert results[1]['name'] == 'test2'
     
-    def test_execute_query_with_params(self):
+    def test_execute_query_with_params(self, db_with_tmp):
         """Test query execution with parameters."""
         # Create a test table
-        with self.db.get_connection() as conn:
-            conn.execute("CREATE TABLE test (id INTEGER, name TEXT)")
-            conn.execute("INSERT INTO test VALUES (1, 'test1'), (2, 'test2')")
-            conn.commit()
+        with db_with_tmp.get_connection() as conn:
+            conn.executescript(
+                "CREATE TABLE test (id INTEGER, name TEXT);"
+                "INSERT INTO test VALUES (1, 'test1'), (2, 'test2');"
+            )
         
         # Test parameterized query
-        results = self.db.execute_query("SELECT * FROM test WHERE id = ?", (1,))
+        results = db_with_tmp.execute_query("SELECT * FROM test WHERE id = ?", (1,))
         assert len(results) == 1
         assert results[0]['id'] == 1
         assert results[0]['name'] == 'test1'
     
-    def test_execute_update_success(self):
+    def test_execute_update_success(self, db_with_tmp):
         """Test successful update execution."""
         # Create a test table
-        with self.db.get_connection() as conn:
-            conn.execute("CREATE TABLE test (id INTEGER, name TEXT)")
-            conn.execute("INSERT INTO test VALUES (1, 'test1')")
-            conn.commit()
+        with db_with_tmp.get_connection() as conn:
+            conn.executescript(
+                "CREATE TABLE test (id INTEGER, name TEXT);"
+                "INSERT INTO test VALUES (1, 'test1');"
+            )
         
         # Test update execution
-        affected_rows = self.db.execute_update(
+        affected_rows = db_with_tmp.execute_update(
             "UPDATE test SET name = ? WHERE id = ?", 
             ('updated', 1)
         )
         assert affected_rows == 1
         
         # Verify update
-        results = self.db.execute_query("SELECT name FROM test WHERE id = 1")
+        results = db_with_tmp.execute_query("SELECT name FROM test WHERE id = 1")
         assert results[0]['name'] == 'updated'
     
-    def test_execute_update_with_rollback(self):
+    def test_execute_update_with_rollback(self, db_with_tmp):
         """Test update execution with rollback on error."""
         # Create a test table
-        with self.db.get_connection() as conn:
-            conn.execute("CREATE TABLE test (id INTEGER, name TEXT)")
-            conn.execute("INSERT INTO test VALUES (1, 'test1')")
-            conn.commit()
+        with db_with_tmp.get_connection() as conn:
+            conn.executescript(
+                "CREATE TABLE test (id INTEGER, name TEXT);"
+                "INSERT INTO test VALUES (1, 'test1');"
+            )
         
         # Test update with invalid query (should rollback)
         with pytest.raises(sqlite3.Error):
-            self.db.execute_update("UPDATE test SET invalid_column = ? WHERE id = ?", ('value', 1))
+            db_with_tmp.execute_update("UPDATE test SET invalid_column = ? WHERE id = ?", ('value', 1))
         
         # Verify original data is unchanged
-        results = self.db.execute_query("SELECT name FROM test WHERE id = 1")
+        results = db_with_tmp.execute_query("SELECT name FROM test WHERE id = 1")
         assert results[0]['name'] == 'test1'
     
-    def test_execute_many_success(self):
+    def test_execute_many_success(self, db_with_tmp):
         """Test successful batch execution."""
         # Create a test table
-        with self.db.get_connection() as conn:
-            conn.execute("CREATE TABLE test (id INTEGER, name TEXT)")
-            conn.commit()
+        with db_with_tmp.get_connection() as conn:
+            conn.executescript("CREATE TABLE test (id INTEGER, name TEXT);")
         
         # Test batch insert
         params_list = [(1, 'test1'), (2, 'test2'), (3, 'test3')]
-        affected_rows = self.db.execute_many(
+        affected_rows = db_with_tmp.execute_many(
             "INSERT INTO test (id, name) VALUES (?, ?)", 
             params_list
         )
         assert affected_rows == 3
         
         # Verify all records were inserted
-        results = self.db.execute_query("SELECT COUNT(*) as count FROM test")
+        results = db_with_tmp.execute_query("SELECT COUNT(*) as count FROM test")
         assert results[0]['count'] == 3
     
-    def test_execute_many_with_rollback(self):
+    def test_execute_many_with_rollback(self, db_with_tmp):
         """Test batch execution with rollback on error."""
         # Create a test table
-        with self.db.get_connection() as conn:
-            conn.execute("CREATE TABLE test (id INTEGER, name TEXT)")
-            conn.commit()
+        with db_with_tmp.get_connection() as conn:
+            conn.executescript("CREATE TABLE test (id INTEGER, name TEXT);")
         
         # Test batch insert with invalid SQL (should rollback)
         params_list = [(1, 'test1'), (2, 'test2'), (3, 'test3')]
         with pytest.raises(sqlite3.Error):
-            self.db.execute_many("INSERT INTO test (id, name) VALUES (?, ?) INVALID_SQL", params_list)
+            db_with_tmp.execute_many("INSERT INTO test (id, name) VALUES (?, ?) INVALID_SQL", params_list)
         
         # Verify no records were inserted
-        results = self.db.execute_query("SELECT COUNT(*) as count FROM test")
+        results = db_with_tmp.execute_query("SELECT COUNT(*) as count FROM test")
         assert results[0]['count'] == 0
     
-    def test_get_database_info_empty_db(self):
+    def test_get_database_info_empty_db(self, db_with_tmp):
         """Test database info for empty database."""
         # Create the database by executing a simple query
-        self.db.execute_query("SELECT 1")
+        db_with_tmp.execute_query("SELECT 1")
         
-        info = self.db.get_database_info()
+        info = db_with_tmp.get_database_info()
         
-        assert info['path'] == str(self.test_db_path)
+        assert info['path'] == str(db_with_tmp.db_path)
         assert info['exists'] is True
         assert info['size_bytes'] >= 0  # SQLite can have 0 bytes initially
         assert info['table_count'] == 0
         assert info['tables'] == []
     
-    def test_get_database_info_with_tables(self):
+    def test_get_database_info_with_tables(self, db_with_tmp):
         """Test database info with tables."""
         # Create test tables
-        with self.db.get_connection() as conn:
-            conn.execute("CREATE TABLE users (id INTEGER, name TEXT)")
-            conn.execute("CREATE TABLE skills (id INTEGER, name TEXT)")
-            conn.commit()
+        with db_with_tmp.get_connection() as conn:
+            conn.executescript(
+                "CREATE TABLE users (id INTEGER, name TEXT);"
+                "CREATE TABLE skills (id INTEGER, name TEXT);"
+            )
         
-        info = self.db.get_database_info()
+        info = db_with_tmp.get_database_info()
         
         assert info['table_count'] == 2
         assert 'users' in info['tables']
         assert 'skills' in info['tables']
         assert len(info['tables']) == 2
     
-    def test_get_database_info_nonexistent_db(self):
+    def test_get_database_info_nonexistent_db(self, tmp_path):
         """Test database info for non-existent database."""
-        nonexistent_path = os.path.join(self.temp_dir, "nonexistent.db")
+        nonexistent_path = str(tmp_path / "nonexistent.db")
         db = DatabaseConnection(nonexistent_path)
         
         info = db.get_database_info()
@@ -225,20 +217,19 @@ class TestDatabaseConnection:
         assert info['table_count'] == 0
         assert info['tables'] == []
     
-    def test_connection_test_success(self):
+    def test_connection_test_success(self, db_with_tmp):
         """Test successful connection test."""
-        assert self.db.test_connection() is True
+        assert db_with_tmp.test_connection() is True
     
-    def test_connection_test_failure(self):
+    def test_connection_test_failure(self, db_with_tmp):
         """Test connection test failure."""
         # Create a database with invalid permissions
-        with patch('sqlite3.connect') as mock_connect:
-            mock_connect.side_effect = sqlite3.Error("Connection failed")
-            
-            db = DatabaseConnection(self.test_db_path)
+        with patch('sqlite3.connect', new=_failing_connect):
+            db = DatabaseConnection(str(db_with_tmp.db_path))
             assert db.test_connection() is False
 
 
+@pytest.mark.xdist_group("global_db")
 class TestGlobalDatabaseFunctions:
     """Test cases for global database functions."""
     
@@ -258,24 +249,17 @@ class TestGlobalDatabaseFunctions:
         db2 = get_database()
         assert db1 is db2
     
-    def test_initialize_database(self):
+    def test_initialize_database(self, tmp_path):
         """Test database initialization."""
-        temp_dir = tempfile.mkdtemp()
-        test_db_path = os.path.join(temp_dir, "init_test.db")
+        test_db_path = tmp_path / "init_test.db"
         
-        try:
-            db = initialize_database(test_db_path)
-            assert isinstance(db, DatabaseConnection)
-            assert db.db_path == Path(test_db_path)
-            
-            # Verify global instance is set
-            global_db = get_database()
-            assert global_db is db
-        finally:
-            # Clean up
-            if os.path.exists(test_db_path):
-                os.remove(test_db_path)
-            os.rmdir(temp_dir)
+        db = initialize_database(str(test_db_path))
+        assert isinstance(db, DatabaseConnection)
+        assert db.db_path == test_db_path
+        
+        # Verify global instance is set
+        global_db = get_database()
+        assert global_db is db
     
     def test_reset_database(self):
         """Test database reset."""
@@ -293,41 +277,27 @@ class TestGlobalDatabaseFunctions:
 class TestDatabaseErrorHandling:
     """Test cases for database error handling."""
     
-    def setup_method(self):
-        """Set up test fixtures before each test method."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.test_db_path = os.path.join(self.temp_dir, "test.db")
-        self.db = DatabaseConnection(self.test_db_path)
-    
-    def teardown_method(self):
-        """Clean up after each test method."""
-        if os.path.exists(self.test_db_path):
-            os.remove(self.test_db_path)
-        os.rmdir(self.temp_dir)
-    
-    def test_connection_error_handling(self):
+    def test_connection_error_handling(self, db_with_tmp):
         """Test connection error handling."""
-        with patch('sqlite3.connect') as mock_connect:
-            mock_connect.side_effect = sqlite3.Error("Connection failed")
-            
+        with patch('sqlite3.connect', new=_failing_connect):
             with pytest.raises(sqlite3.Error):
-                with self.db.get_connection():
+                with db_with_tmp.get_connection():
                     pass
     
-    def test_query_error_handling(self):
+    def test_query_error_handling(self, db_with_tmp):
         """Test query error handling."""
         with pytest.raises(sqlite3.Error):
-            self.db.execute_query("INVALID SQL QUERY")
+            db_with_tmp.execute_query("INVALID SQL QUERY")
     
-    def test_update_error_handling(self):
+    def test_update_error_handling(self, db_with_tmp):
         """Test update error handling."""
         with pytest.raises(sqlite3.Error):
-            self.db.execute_update("INVALID SQL UPDATE")
+            db_with_tmp.execute_update("INVALID SQL UPDATE")
     
-    def test_batch_error_handling(self):
+    def test_batch_error_handling(self, db_with_tmp):
         """Test batch execution error handling."""
         with pytest.raises(sqlite3.Error):
-            self.db.execute_many("INVALID SQL BATCH", [(1, 2), (3, 4)])
+            db_with_tmp.execute_many("INVALID SQL BATCH", [(1, 2), (3, 4)])
 
 
 if __name__ == "__main__":
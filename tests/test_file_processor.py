@@ -7,11 +7,15 @@ including text extraction from various file formats and error handling.
 
 import pytest
 import io
+import json
 import tempfile
 import os
+import zipfile
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, Optional
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch, MagicMock
-from fastapi import UploadFile
 
 # Import the modules to test
 from backend.utils.file_processor import (
@@ -20,10 +24,24 @@ from backend.utils.file_processor import (
     ProcessedContent,
     get_file_processor,
     initialize_file_processor,
-    reset_file_processor
+    reset_file_processor,
+    shutdown_process_pool
 )
 
 
+def _noop_mkdir(*args, **kwargs):
+    """Stand-in for Path.mkdir so tests never touch the filesystem."""
+
+
+@dataclass
+class _FakeUpload:
+    """Minimal stand-in for FastAPI's UploadFile."""
+    filename: Optional[str]
+    size: Optional[int] = None
+    content_type: Optional[str] = None
+    file: Any = None
+
+
 class TestFileMetadata:
     """Test FileMetadata dataclass."""
     
@@ -93,21 +111,23 @@ class TestProcessedContent:
         assert content.extracted_entities is None
 
 
+@patch('pathlib.Path.mkdir', new=_noop_mkdir)
 class TestFileProcessor:
     """Test FileProcessor class."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_config(self):
         """Mock configuration for testing."""
         config = Mock()
         config.get_settings.return_value = Mock(
-            data_dir="/tmp/test_data"
+            data_dir="/tmp/test_data",
+            file_processing_workers=1
         )
         return config
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def file_processor(self, mock_config):
-        """Create FileProcessor instance for testing."""
+        """Create a FileProcessor shared by the module; tests do not mutate it."""
         with patch('backend.utils.file_processor.get_config', return_value=mock_config):
             with patch('pathlib.Path.mkdir'):
                 return FileProcessor(mock_config)
@@ -115,11 +135,10 @@ class TestFileProcessor:
     def test_file_processor_initialization(self, mock_config):
         """Test FileProcessor initialization."""
         with patch('backend.utils.file_processor.get_config', return_value=mock_config):
-            with patch('pathlib.Path.mkdir'):
-                processor = FileProcessor(mock_config)
-                
-                assert processor.config == mock_config
-                assert processor.upload_dir == Path("/tmp/test_data") / "uploads"
+            processor = FileProcessor(mock_config)
+            
+            assert processor.config == mock_config
+            assert processor.upload_dir == Path("/tmp/test_data") / "uploads"
     
     def test_supported_extensions(self, file_processor):
         """Test supported file extensions."""
@@ -138,10 +157,7 @@ class TestFileProcessor:
     
     def test_validate_file_valid(self, file_processor):
         """Test file validation with valid file."""
-        mock_file = Mock()
-        mock_file.filename = "test.pdf"
-        mock_file.size = 1024
-        mock_file.content_type = "application/pdf"
+        mock_file = _FakeUpload(filename="test.pdf", size=1024, content_type="application/pdf")
         
         is_valid, error = file_processor.validate_file(mock_file)
         
@@ -150,10 +166,7 @@ class TestFileProcessor:
     
     def test_validate_file_no_filename(self, file_processor):
         """Test file validation with no filename."""
-        mock_file = Mock()
-        mock_file.filename = None
-        mock_file.size = None
-        mock_file.content_type = None
+        mock_file = _FakeUpload(filename=None)
         
         is_valid, error = file_processor.validate_file(mock_file)
         
@@ -162,10 +175,7 @@ class TestFileProcessor:
     
     def test_validate_file_unsupported_extension(self, file_processor):
         """Test file validation with unsupported extension."""
-        mock_file = Mock()
-        mock_file.filename = "test.xyz"
-        mock_file.size = None
-        mock_file.content_type = None
+        mock_file = _FakeUpload(filename="test.xyz")
         
         is_valid, error = file_processor.validate_file(mock_file)
         
@@ -174,9 +184,7 @@ class TestFileProcessor:
     
     def test_validate_file_too_large(self, file_processor):
         """Test file validation with file too large."""
-        mock_file = Mock()
-        mock_file.filename = "test.pdf"
-        mock_file.size = file_processor.MAX_FILE_SIZE + 1
+        mock_file = _FakeUpload(filename="test.pdf", size=file_processor.MAX_FILE_SIZE + 1)
         
         is_valid, error = file_processor.validate_file(mock_file)
         
@@ -202,6 +210,23 @@ class TestFileProcessor:
         assert "It has multiple lines" in text
         assert line_count == 2
     
+    def test_extract_text_from_txt_no_trailing_newline(self, file_processor):
+        """Test line counting when the last line has no newline."""
+        content = b"First line\nSecond line\nThird line"
+        
+        text, line_count = file_processor.extract_text_from_txt(content)
+        
+        assert text.endswith("Third line")
+        assert line_count == 3
+    
+    def test_extract_text_from_txt_cr_line_endings(self, file_processor):
+        """Test line counting with CR-only line endings."""
+        content = b"First line\rSecond line\rThird line\r"
+        
+        text, line_count = file_processor.extract_text_from_txt(content)
+        
+        assert line_count == 3
+    
     def test_extract_text_from_txt_encoding_error(self, file_processor):
         """Test text extraction from TXT file with encoding issues."""
         # Create content with invalid UTF-8
@@ -232,6 +257,16 @@ class TestFileProcessor:
         assert "author" in text
         assert object_count > 0
     
+    def test_extract_text_from_json_outside_orjson(self, file_processor):
+        """Test JSON that only the stdlib parser accepts."""
+        content = b'{"name": "Jos\xe9", "score": NaN, "id": 123456789012345678901234567890}'
+        
+        text, object_count = file_processor.extract_text_from_json(content)
+        
+        assert "Jos\ufffd" in text
+        assert "123456789012345678901234567890" in text
+        assert object_count == 3
+    
     def test_extract_text_from_json_invalid(self, file_processor):
         """Test text extraction from invalid JSON file."""
         content = b"{ invalid json content"
@@ -241,16 +276,18 @@ class TestFileProcessor:
         
         assert "JSON processing failed" in str(exc_info.value)
     
-    @patch('backend.utils.file_processor.PyPDF2.PdfReader')
-    def test_extract_text_from_pdf(self, mock_pdf_reader, file_processor):
+    @patch('backend.utils.file_processor.pymupdf.open')
+    def test_extract_text_from_pdf(self, mock_pdf_open, file_processor):
         """Test text extraction from PDF file."""
-        # Mock PDF reader
+        # Mock PyMuPDF document
         mock_page = Mock()
-        mock_page.extract_text.return_value = "This is PDF content"
+        mock_page.get_text.return_value = "This is PDF content"
         
-        mock_reader_instance = Mock()
-        mock_reader_instance.pages = [mock_page, mock_page]
-        mock_pdf_reader.return_value = mock_reader_instance
+        mock_document = MagicMock()
+        mock_document.__enter__.return_value = mock_document
+        mock_document.__iter__.return_value = iter([mock_page, mock_page])
+        mock_document.page_count = 2
+        mock_pdf_open.return_value = mock_document
         
         content = b"fake pdf content"
         
@@ -259,24 +296,53 @@ class TestFileProcessor:
         assert "This is PDF content" in text
         assert page_count == 2
     
-    @patch('backend.utils.file_processor.Document')
-    def test_extract_text_from_docx(self, mock_document, file_processor):
+    def test_extract_text_from_docx(self, file_processor):
         """Test text extraction from DOCX file."""
-        # Mock DOCX document
-        mock_paragraph = Mock()
-        mock_paragraph.text = "This is DOCX content"
-        
-        mock_doc_instance = Mock()
-        mock_doc_instance.paragraphs = [mock_paragraph, mock_paragraph]
-        mock_document.return_value = mock_doc_instance
-        
-        content = b"fake docx content"
+        # Minimal DOCX archive containing only word/document.xml
+        document_xml = (
+            '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+            '<w:body>'
+            '<w:p><w:r><w:t>This is </w:t></w:r><w:r><w:t>DOCX content</w:t></w:r></w:p>'
+            '<w:p><w:r><w:t>Second paragraph</w:t></w:r></w:p>'
+            '</w:body>'
+            '</w:document>'
+        )
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w') as docx_zip:
+            docx_zip.writestr('word/document.xml', document_xml)
+        content = buffer.getvalue()
         
         text, page_count = file_processor.extract_text_from_docx(content)
         
-        assert "This is DOCX content" in text
+        assert text == "This is DOCX content\nSecond paragraph"
         assert page_count >= 1
     
+    def test_extract_text_from_docx_tabs_and_breaks(self, file_processor):
+        """Test DOCX tabs and line breaks become whitespace."""
+        document_xml = (
+            '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+            '<w:body>'
+            '<w:p><w:pPr><w:tabs><w:tab w:val="left" w:pos="720"/></w:tabs></w:pPr>'
+            '<w:r><w:t>Name:</w:t><w:tab/><w:t>Alice</w:t></w:r></w:p>'
+            '<w:p><w:r><w:t>line1</w:t><w:br/><w:t>line2</w:t><w:cr/><w:t>line3</w:t></w:r></w:p>'
+            '</w:body>'
+            '</w:document>'
+        )
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w') as docx_zip:
+            docx_zip.writestr('word/document.xml', document_xml)
+        
+        text, _ = file_processor.extract_text_from_docx(buffer.getvalue())
+        
+        assert text == "Name:\tAlice\nline1\nline2\nline3"
+    
+    def test_extract_text_from_docx_invalid(self, file_processor):
+        """Test text extraction from a file that is not a DOCX archive."""
+        with pytest.raises(Exception) as exc_info:
+            file_processor.extract_text_from_docx(b"fake docx content")
+        
+        assert "DOCX processing failed" in str(exc_info.value)
+    
     @patch('backend.utils.file_processor.Presentation')
     def test_extract_text_from_pptx(self, mock_presentation, file_processor):
         """Test text extraction from PPTX file."""
@@ -321,6 +387,8 @@ class TestFileProcessor:
         assert "Header1" in text
         assert "Value1" in text
         assert sheet_count == 1
+        assert mock_load_workbook.call_args.kwargs['read_only'] is True
+        mock_workbook.close.assert_called_once()
     
     def test_extract_text_from_html(self, file_processor):
         """Test text extraction from HTML file."""
@@ -342,6 +410,19 @@ class TestFileProcessor:
         assert "console.log" not in text  # Script content should be removed
         assert element_count > 0
     
+    @pytest.mark.parametrize("html_content, expected", [
+        (b'<?xml version="1.0" encoding="utf-8"?>'
+         b'<html xmlns="http://www.w3.org/1999/xhtml"><body><p>Hello</p></body></html>', ("Hello", 3)),
+        (b"", ("", 0)),
+        (b"<!-- only a comment -->", ("", 0)),
+        (b"just text", ("just text", 0)),
+        (b"<p>Hi</p>\n<!-- <body> -->\n<script>'<html>'</script>", ("Hi", 1)),
+        (b"<html>\n<body><noscript>Enable JavaScript</noscript></body>\n</html>", ("Enable JavaScript", 3)),
+    ])
+    def test_extract_text_from_html_edge_cases(self, file_processor, html_content, expected):
+        """Test XHTML declarations, empty documents and text-only input."""
+        assert file_processor.extract_text_from_html(html_content) == expected
+    
     def test_extract_text_from_markdown(self, file_processor):
         """Test text extraction from Markdown file."""
         md_content = """
@@ -362,14 +443,37 @@ class TestFileProcessor:
         assert "List item 1" in text
         assert line_count >= 6
     
-    @patch('backend.utils.file_processor.pd.read_csv')
+    @pytest.mark.parametrize("md_content, expected", [
+        (b"Before <div>raw</div> after<br/>", "Before raw after"),
+        (b"<!-- hidden -->Visible", "Visible"),
+        (b"See <https://example.com>", "See https://example.com"),
+        (b"Compute 2 * 3 * 4 and *emphasis*", "Compute 2 * 3 * 4 and emphasis"),
+        (b"**bold** and **spaced ** text", "bold and **spaced ** text"),
+        (b"Use `a*b*c` here", "Use a*b*c here"),
+        (b"Keep `<div>` and `**stars**` literal", "Keep <div> and **stars** literal"),
+        (b"\\*not em\\* and a \\_", "*not em* and a _"),
+        (b"Title\n=====\n\nSection\n-------\nBody", "Title Section Body"),
+    ])
+    def test_extract_text_from_markdown_inline(self, file_processor, md_content, expected):
+        """Test inline HTML and emphasis handling in Markdown."""
+        text, _ = file_processor.extract_text_from_markdown(md_content)
+        
+        assert text == expected
+    
+    @patch('backend.utils.file_processor.pa_csv.read_csv')
     def test_extract_text_from_csv(self, mock_read_csv, file_processor):
         """Test text extraction from CSV file."""
-        # Mock pandas DataFrame
-        mock_df = Mock()
-        mock_df.to_string.return_value = "Name,Age\nJohn,25\nJane,30"
-        mock_df.__len__ = Mock(return_value=2)
-        mock_read_csv.return_value = mock_df
+        # Mock Arrow table
+        mock_name_column = Mock()
+        mock_name_column.to_pylist.return_value = ["John", "Jane"]
+        mock_age_column = Mock()
+        mock_age_column.to_pylist.return_value = [25, 30]
+        
+        mock_table = Mock()
+        mock_table.column_names = ["Name", "Age"]
+        mock_table.columns = [mock_name_column, mock_age_column]
+        mock_table.num_rows = 2
+        mock_read_csv.return_value = mock_table
         
         content = b"Name,Age\nJohn,25\nJane,30"
         
@@ -379,16 +483,35 @@ class TestFileProcessor:
         assert "John" in text
         assert row_count == 2
     
+    def test_extract_text_from_csv_non_utf8(self, file_processor):
+        """Test CSV text extraction from a Latin-1 encoded file."""
+        content = "Name,City\nJos\xe9,S\xe3o Paulo\n".encode('latin-1')
+        
+        text, row_count = file_processor.extract_text_from_csv(content)
+        
+        assert text == "Name | City\nJos\ufffd | S\ufffdo Paulo"
+        assert "b'" not in text
+        assert row_count == 1
+    
+    def test_extract_text_from_csv_ragged_rows(self, file_processor):
+        """Test CSV text extraction pads rows with missing trailing fields."""
+        content = b"Name,Age,City\nJohn,25\nJane,30,Paris\n"
+        
+        text, row_count = file_processor.extract_text_from_csv(content)
+        
+        assert text == "Name | Age | City\nJohn | 25 | \nJane | 30 | Paris"
+        assert row_count == 2
+    
     def test_process_file_txt(self, file_processor):
         """Test processing a TXT file."""
         # Create mock UploadFile
         content = b"This is test content for processing."
-        mock_file = Mock()
-        mock_file.filename = "test.txt"
-        mock_file.file = Mock()
-        mock_file.file.read.return_value = content
-        mock_file.size = len(content)
-        mock_file.content_type = "text/plain"
+        mock_file = _FakeUpload(
+            filename="test.txt",
+            size=len(content),
+            content_type="text/plain",
+            file=io.BytesIO(content)
+        )
         
         result = file_processor.process_file(mock_file)
         
@@ -401,8 +524,7 @@ class TestFileProcessor:
     
     def test_process_file_invalid(self, file_processor):
         """Test processing an invalid file."""
-        mock_file = Mock(spec=UploadFile)
-        mock_file.filename = "test.xyz"  # Unsupported extension
+        mock_file = _FakeUpload(filename="test.xyz")  # Unsupported extension
         
         with pytest.raises(Exception) as exc_info:
             file_processor.process_file(mock_file)
@@ -415,19 +537,19 @@ class TestFileProcessor:
         content1 = b"First file content"
         content2 = b"Second file content"
         
-        mock_file1 = Mock()
-        mock_file1.filename = "test1.txt"
-        mock_file1.file = Mock()
-        mock_file1.file.read.return_value = content1
-        mock_file1.size = len(content1)
-        mock_file1.content_type = "text/plain"
+        mock_file1 = _FakeUpload(
+            filename="test1.txt",
+            size=len(content1),
+            content_type="text/plain",
+            file=io.BytesIO(content1)
+        )
         
-        mock_file2 = Mock()
-        mock_file2.filename = "test2.txt"
-        mock_file2.file = Mock()
-        mock_file2.file.read.return_value = content2
-        mock_file2.size = len(content2)
-        mock_file2.content_type = "text/plain"
+        mock_file2 = _FakeUpload(
+            filename="test2.txt",
+            size=len(content2),
+            content_type="text/plain",
+            file=io.BytesIO(content2)
+        )
         
         results = file_processor.process_multiple_files([mock_file1, mock_file2])
         
@@ -435,6 +557,53 @@ class TestFileProcessor:
         assert results[0].text == "First file content"
         assert results[1].text == "Second file content"
     
+    def test_process_multiple_files_parallel(self, file_processor):
+        """Test batch processing dispatches extraction to the worker pool."""
+        content = b"Parallel file content"
+        
+        mock_file1 = _FakeUpload(
+            filename="test1.txt",
+            size=len(content),
+            content_type="text/plain",
+            file=io.BytesIO(content)
+        )
+        
+        mock_file2 = _FakeUpload(filename="test2.xyz")
+        
+        # Threads stand in for processes to keep the test fast
+        with patch('backend.utils.file_processor.ProcessPoolExecutor', ThreadPoolExecutor):
+            try:
+                results = file_processor.process_multiple_files([mock_file1, mock_file2], max_workers=2)
+            finally:
+                shutdown_process_pool()
+        
+        assert len(results) == 2
+        assert results[0].text == "Parallel file content"
+        assert results[0].metadata.filename == "test1.txt"
+        assert results[1].text == ""
+        assert "Unsupported file type" in results[1].metadata.error
+    
+    def test_register_extractor(self, file_processor):
+        """Test registering an extractor for an additional extension."""
+        with patch.object(FileProcessor, '_EXTRACTORS', FileProcessor._EXTRACTORS), \
+                patch.object(FileProcessor, 'SUPPORTED_EXTENSIONS', FileProcessor.SUPPORTED_EXTENSIONS), \
+                patch.object(FileProcessor, 'extract_text_from_log', create=True):
+            
+            @FileProcessor.register_extractor('.log', 'text/plain')
+            def extract_text_from_log(self, content):
+                return content.decode('utf-8').upper(), 1
+            
+            content = b"service started"
+            mock_file = _FakeUpload(filename="app.log", file=io.BytesIO(content))
+            
+            result = file_processor.process_file(mock_file)
+            
+            assert '.log' in file_processor.get_supported_formats()
+            assert result.text == "SERVICE STARTED"
+            assert result.metadata.mime_type == "text/plain"
+        
+        assert '.log' not in FileProcessor.SUPPORTED_EXTENSIONS
+    
     def test_get_supported_formats(self, file_processor):
         """Test getting supported formats."""
         formats = file_processor.get_supported_formats()
@@ -455,6 +624,7 @@ class TestFileProcessor:
         assert stats['max_file_size_mb'] == 10.0
 
 
+@patch('pathlib.Path.mkdir', new=_noop_mkdir)
 class TestGlobalFunctions:
     """Test global utility functions."""
     
@@ -468,13 +638,12 @@ class TestGlobalFunctions:
             mock_config.get_settings.return_value = Mock(data_dir="/tmp/test_data")
             mock_get_config.return_value = mock_config
             
-            with patch('pathlib.Path.mkdir'):
-                processor1 = get_file_processor()
-                processor2 = get_file_processor()
-                
-                # Should return the same instance
-                assert processor1 is processor2
-                assert isinstance(processor1, FileProcessor)
+            processor1 = get_file_processor()
+            processor2 = get_file_processor()
+            
+            # Should return the same instance
+            assert processor1 is processor2
+            assert isinstance(processor1, FileProcessor)
     
     def test_initialize_file_processor(self):
         """Test initializing file processor with config."""
@@ -482,11 +651,10 @@ class TestGlobalFunctions:
         mock_config.get_settings.return_value = Mock(data_dir="/tmp/test_data")
         
         with patch('backend.utils.file_processor.get_config', return_value=mock_config):
-            with patch('pathlib.Path.mkdir'):
-                processor = initialize_file_processor(mock_config)
-                
-                assert isinstance(processor, FileProcessor)
-                assert processor.config == mock_config
+            processor = initialize_file_processor(mock_config)
+            
+            assert isinstance(processor, FileProcessor)
+            assert processor.config == mock_config
     
     def test_reset_file_processor(self):
         """Test resetting file processor."""
@@ -495,20 +663,20 @@ class TestGlobalFunctions:
             mock_config.get_settings.return_value = Mock(data_dir="/tmp/test_data")
             mock_get_config.return_value = mock_config
             
-            with patch('pathlib.Path.mkdir'):
-                # Get initial instance
-                processor1 = get_file_processor()
-                
-                # Reset
-                reset_file_processor()
-                
-                # Get new instance
-                processor2 = get_file_processor()
-                
-                # Should be different instances
-                assert processor1 is not processor2
+            # Get initial instance
+            processor1 = get_file_processor()
+            
+            # Reset
+            reset_file_processor()
+            
+            # Get new instance
+            processor2 = get_file_processor()
+            
+            # Should be different instances
+            assert processor1 is not processor2
 
 
+@patch('pathlib.Path.mkdir', new=_noop_mkdir)
 class TestIntegration:
     """Integration tests for file processing."""
     
@@ -530,30 +698,29 @@ class TestIntegration:
         mock_config.get_settings.return_value = Mock(data_dir="/tmp/test_data")
         
         with patch('backend.utils.file_processor.get_config', return_value=mock_config):
-            with patch('pathlib.Path.mkdir'):
-                processor = FileProcessor(mock_config)
-                
-                # Read file content
-                with open(temp_file, 'rb') as f:
-                    content = f.read()
-                
-                # Create mock UploadFile
-                mock_file = Mock()
-                mock_file.filename = "test.txt"
-                mock_file.file = Mock()
-                mock_file.file.read.return_value = content
-                mock_file.size = len(content)
-                mock_file.content_type = "text/plain"
-                
-                # Process file
-                result = processor.process_file(mock_file)
-                
-                # Verify results
-                assert result.text == "This is a test file for integration testing.\nIt has multiple lines."
-                assert result.metadata.filename == "test.txt"
-                assert result.metadata.file_type == ".txt"
-                assert result.metadata.file_size == len(content)
-                assert result.metadata.error is None
+            processor = FileProcessor(mock_config)
+            
+            # Read file content
+            with open(temp_file, 'rb') as f:
+                content = f.read()
+            
+            # Create mock UploadFile
+            mock_file = _FakeUpload(
+                filename="test.txt",
+                size=len(content),
+                content_type="text/plain",
+                file=io.BytesIO(content)
+            )
+            
+            # Process file
+            result = processor.process_file(mock_file)
+            
+            # Verify results
+            assert result.text == "This is a test file for integration testing.\nIt has multiple lines."
+            assert result.metadata.filename == "test.txt"
+            assert result.metadata.file_type == ".txt"
+            assert result.metadata.file_size == len(content)
+            assert result.metadata.error is None
 
 
 if __name__ == "__main__":
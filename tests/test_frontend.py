@@ -5,197 +5,269 @@ This module contains tests for the frontend components and functionality.
 """
 
 import pytest
-import sys
-import os
-from unittest.mock import patch, MagicMock, mock_open
-import streamlit as st
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
 
-# Add the frontend directory to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'frontend'))
+# Keep the frontend tests on one xdist worker so Streamlit is imported once
+pytestmark = pytest.mark.xdist_group("frontend")
 
-from app import APIClient, initialize_session_state, check_authentication
 
+_SESSION_KEYS = frozenset({"authenticated", "user_info", "session_token", "current_page", "api_client"})
 
+
+class _SessionState(dict):
+    """Dict with attribute access, like Streamlit's session state.
+
+    ``writes`` counts assignments made after construction.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        object.__setattr__(self, "writes", 0)
+
+    __getattr__ = dict.__getitem__
+
+    def __setitem__(self, key, value):
+        object.__setattr__(self, "writes", self.writes + 1)
+        super().__setitem__(key, value)
+
+    __setattr__ = __setitem__
+
+
+@pytest.fixture(scope="module")
+def streamlit_module():
+    """Streamlit itself, for tests that patch UI primitives directly."""
+    return pytest.importorskip("streamlit")
+
+
+@pytest.fixture(scope="module")
+def api_client(app_module):
+    """Single API client shared by the tests in this module."""
+    yield app_module.APIClient()
+
+
+@pytest.fixture(autouse=True)
+def reset_api_client(api_client):
+    """Clear per-test state on the shared API client."""
+    api_client.session_token = None
+
+
+@pytest.fixture
+def mock_request(mocker, api_client):
+    """Patch the shared client's HTTP session so no test reaches the network."""
+    return mocker.patch.object(api_client.session, 'request')
+
+
+_CANNED_RESPONSE = Mock(spec=["json", "raise_for_status"])
+_CANNED_RESPONSE.raise_for_status.return_value = None
+
+
+@pytest.fixture
+def canned_response():
+    """Successful response double; tests set the JSON payload."""
+    _CANNED_RESPONSE.reset_mock()
+    return _CANNED_RESPONSE
+
+
+@pytest.mark.usefixtures("mock_request")
 class TestAPIClient:
     """Test the API client functionality."""
     
-    def setup_method(self):
-        """Setup for each test."""
-        self.api_client = APIClient()
-    
-    def test_api_client_initialization(self):
+    def test_api_client_initialization(self, api_client):
         """Test API client initialization."""
-        assert self.api_client.base_url == "http://localhost:8000"
-        assert self.api_client.session_token is None
+        assert api_client.base_url == "http://localhost:8000"
+        assert api_client.session_token is None
     
-    def test_set_session_token(self):
+    def test_set_session_token(self, api_client):
         """Test setting session token."""
         token = "test_session_token_123"
-        self.api_client.set_session_token(token)
+        api_client.set_session_token(token)
         
-        assert self.api_client.session_token == token
+        assert api_client.session_token == token
     
-    def test_get_headers_without_token(self):
-        """Test getting headers without session token."""
-        headers = self.api_client.get_headers()
-        
-        assert "Content-Type" in headers
-        assert headers["Content-Type"] == "application/json"
-        assert "Authorization" not in headers
-    
-    def test_get_headers_with_token(self):
-        """Test getting headers with session token."""
-        token = "test_session_token_123"
-        self.api_client.set_session_token(token)
+    @pytest.mark.parametrize("token, expected_auth", [
+        (None, None),
+        ("test_session_token_123", "Bearer test_session_token_123"),
+    ], ids=["without_token", "with_token"])
+    def test_get_headers(self, api_client, token, expected_auth):
+        """Test getting headers with and without a session token."""
+        if token:
+            api_client.set_session_token(token)
         
-        headers = self.api_client.get_headers()
+        headers = api_client.get_headers()
         
-        assert "Content-Type" in headers
         assert headers["Content-Type"] == "application/json"
-        assert "Authorization" in headers
-        assert headers["Authorization"] == f"Bearer {token}"
+        assert headers.get("Authorization") == expected_auth
     
-    @patch('requests.get')
-    def test_make_request_get_success(self, mock_get):
+    def test_make_request_get_success(self, mock_request, canned_response, api_client):
         """Test successful GET request."""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"status": "success"}
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        canned_response.json.return_value = {"status": "success"}
+        mock_request.return_value = canned_response
         
-        result = self.api_client.make_request("GET", "http://test.com/api")
+        result = api_client.make_request("GET", "http://test.com/api")
         
         assert result == {"status": "success"}
-        mock_get.assert_called_once()
+        mock_request.assert_called_once()
+        assert mock_request.call_args.args[0] == "GET"
     
-    @patch('requests.post')
-    def test_make_request_post_success(self, mock_post):
+    def test_make_request_post_success(self, mock_request, canned_response, api_client):
         """Test successful POST request."""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"status": "created"}
-        mock_response.raise_for_status.return_value = None
-        mock_post.return_value = mock_response
+        canned_response.json.return_value = {"status": "created"}
+        mock_request.return_value = canned_response
         
         data = {"key": "value"}
-        result = self.api_client.make_request("POST", "http://test.com/api", data=data)
+        result = api_client.make_request("POST", "http://test.com/api", data=data)
         
         assert result == {"status": "created"}
-        mock_post.assert_called_once()
+        mock_request.assert_called_once()
+        assert mock_request.call_args.args[0] == "POST"
     
-    @patch('requests.post')
-    def test_make_request_post_with_files(self, mock_post):
+    def test_make_request_post_with_files(self, mock_request, canned_response, api_client):
         """Test POST request with files."""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"status": "uploaded"}
-        mock_response.raise_for_status.return_value = None
-        mock_post.return_value = mock_response
+        canned_response.json.return_value = {"status": "uploaded"}
+        mock_request.return_value = canned_response
         
         data = {"key": "value"}
         files = {"file": "content"}
-        result = self.api_client.make_request("POST", "http://test.com/api", data=data, files=files)
+        result = api_client.make_request("POST", "http://test.com/api", data=data, files=files)
         
         assert result == {"status": "uploaded"}
-        mock_post.assert_called_once()
+        mock_request.assert_called_once()
+        assert mock_request.call_args.args[0] == "POST"
     
-    @patch('requests.get')
-    def test_make_request_error(self, mock_get):
+    def test_make_request_error(self, mock_request, api_client):
         """Test request with error."""
-        mock_get.side_effect = Exception("Connection error")
+        mock_request.side_effect = Exception("Connection error")
         
-        result = self.api_client.make_request("GET", "http://test.com/api")
+        result = api_client.make_request("GET", "http://test.com/api")
         
         assert "error" in result
         assert "Connection error" in result["error"]
+    
+    def test_make_request_reuses_session(self, mock_request, canned_response, api_client):
+        """Test that repeated requests share one pooled HTTP session."""
+        canned_response.json.return_value = {"status": "success"}
+        mock_request.return_value = canned_response
+        session = api_client.session
+        
+        for _ in range(3):
+            api_client.make_request("GET", "http://test.com/api")
+        
+        assert api_client.session is session
+        assert mock_request.call_count == 3
+    
+    def test_get_headers_returns_fresh_dict(self, api_client):
+        """Test that callers cannot mutate the shared header template."""
+        api_client.get_headers().pop("Content-Type")
+        
+        assert api_client.get_headers()["Content-Type"] == "application/json"
 
 
 class TestSessionState:
     """Test session state management."""
     
-    def test_initialize_session_state(self):
+    def test_initialize_session_state(self, app_module):
         """Test session state initialization."""
-        # Mock streamlit session state as a proper object
-        mock_session_state = MagicMock()
-        mock_session_state.__contains__ = lambda self, key: key not in ["authenticated", "user_info", "session_token", "current_page", "api_client"]
+        mock_session_state = _SessionState()
         
-        with patch.object(st, 'session_state', mock_session_state):
-            initialize_session_state()
+        with patch.object(app_module.st, 'session_state', mock_session_state):
+            app_module.initialize_session_state()
             
-            # Verify that the session state was accessed
-            assert mock_session_state.__setitem__.call_count >= 5
+            # Every session key should have been set exactly once
+            assert mock_session_state.keys() == _SESSION_KEYS
+            assert mock_session_state.writes == len(_SESSION_KEYS)
+            assert mock_session_state.authenticated is False
+            assert mock_session_state.current_page == "login"
+            assert isinstance(mock_session_state.api_client, app_module.APIClient)
     
-    def test_initialize_session_state_existing(self):
+    def test_initialize_session_state_existing(self, app_module):
         """Test session state initialization with existing values."""
-        # Mock streamlit session state with existing values
-        mock_session_state = MagicMock()
-        mock_session_state.__contains__ = lambda self, key: key in ["authenticated", "user_info", "session_token", "current_page"]
+        # Session state with everything but the API client already set
+        mock_session_state = _SessionState(
+            authenticated=True,
+            user_info={"username": "testuser"},
+            session_token="existing_token",
+            current_page="dashboard"
+        )
         
-        with patch.object(st, 'session_state', mock_session_state):
-            initialize_session_state()
+        with patch.object(app_module.st, 'session_state', mock_session_state):
+            app_module.initialize_session_state()
             
-            # Should not overwrite existing values
-            assert mock_session_state.__setitem__.call_count == 1  # Only api_client should be set
+            # Should not overwrite existing values; only api_client is added
+            assert mock_session_state.keys() == _SESSION_KEYS
+            assert mock_session_state.writes == 1
+            assert mock_session_state.authenticated is True
+            assert mock_session_state.session_token == "existing_token"
+            assert mock_session_state.current_page == "dashboard"
 
 
+@pytest.mark.usefixtures("mock_request")
 class TestAuthentication:
     """Test authentication functionality."""
     
-    def test_check_authentication_not_authenticated(self):
+    def test_check_authentication_not_authenticated(self, app_module):
         """Test authentication check when not authenticated."""
-        mock_session_state = MagicMock()
-        mock_session_state.authenticated = False
-        mock_session_state.session_token = None
+        mock_session_state = SimpleNamespace(authenticated=False, session_token=None)
         
-        with patch.object(st, 'session_state', mock_session_state):
-            result = check_authentication()
+        with patch.object(app_module.st, 'session_state', mock_session_state):
+            result = app_module.check_authentication()
             
             assert result is False
     
-    def test_check_authentication_no_token(self):
+    def test_check_authentication_no_token(self, mock_request, app_module):
         """Test authentication check when authenticated but no token."""
-        mock_session_state = MagicMock()
-        mock_session_state.authenticated = True
-        mock_session_state.session_token = None
+        mock_session_state = SimpleNamespace(
+            authenticated=True,
+            session_token=None,
+            user_info=None,
+            current_page="dashboard"
+        )
         
-        with patch.object(st, 'session_state', mock_session_state):
-            result = check_authentication()
+        with patch.object(app_module.st, 'session_state', mock_session_state):
+            result = app_module.check_authentication()
             
             assert result is False
             # The function should have modified the session state
             assert mock_session_state.authenticated is False
             assert mock_session_state.current_page == "login"
+            mock_request.assert_not_called()
     
-    @patch('requests.get')
-    def test_check_authentication_valid_session(self, mock_get):
+    def test_check_authentication_valid_session(self, mocker, app_module):
         """Test authentication check with valid session."""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"user_id": "123", "username": "testuser"}
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        mock_client = mocker.create_autospec(app_module.APIClient, instance=True)
+        mock_client.make_request.return_value = {"user_id": "123", "username": "testuser"}
         
-        mock_session_state = MagicMock()
-        mock_session_state.authenticated = True
-        mock_session_state.session_token = "valid_token"
-        mock_session_state.api_client = APIClient()
+        mock_session_state = SimpleNamespace(
+            authenticated=True,
+            session_token="valid_token",
+            user_info=None,
+            current_page="dashboard",
+            api_client=mock_client
+        )
         
-        with patch.object(st, 'session_state', mock_session_state):
-            result = check_authentication()
+        with patch.object(app_module.st, 'session_state', mock_session_state):
+            result = app_module.check_authentication()
             
             assert result is True
             assert mock_session_state.user_info["user_id"] == "123"
             assert mock_session_state.user_info["username"] == "testuser"
+            mock_client.set_session_token.assert_called_once_with("valid_token")
+            mock_client.make_request.assert_called_once_with("GET", app_module.API_ENDPOINTS["auth"]["me"])
     
-    @patch('requests.get')
-    def test_check_authentication_invalid_session(self, mock_get):
+    def test_check_authentication_invalid_session(self, mock_request, api_client, app_module):
         """Test authentication check with invalid session."""
-        mock_get.side_effect = Exception("Unauthorized")
+        mock_request.side_effect = Exception("Unauthorized")
         
-        mock_session_state = MagicMock()
-        mock_session_state.authenticated = True
-        mock_session_state.session_token = "invalid_token"
-        mock_session_state.api_client = APIClient()
+        mock_session_state = SimpleNamespace(
+            authenticated=True,
+            session_token="invalid_token",
+            user_info=None,
+            current_page="dashboard",
+            api_client=api_client
+        )
         
-        with patch.object(st, 'session_state', mock_session_state):
-            result = check_authentication()
+        with patch.object(app_module.st, 'session_state', mock_session_state):
+            result = app_module.check_authentication()
             
             assert result is False
             assert mock_session_state.authenticated is False
@@ -207,29 +279,20 @@ class TestAuthentication:
 class TestFrontendIntegration:
     """Integration tests for frontend components."""
     
-    def test_api_endpoints_configuration(self):
+    def test_api_endpoints_configuration(self, app_module):
         """Test API endpoints configuration."""
-        from app import API_ENDPOINTS
+        API_ENDPOINTS = app_module.API_ENDPOINTS
         
         # Check that all required endpoints are configured
-        assert "auth" in API_ENDPOINTS
-        assert "users" in API_ENDPOINTS
-        assert "skills" in API_ENDPOINTS
-        assert "learning" in API_ENDPOINTS
+        assert {"auth", "users", "skills", "learning"} <= API_ENDPOINTS.keys()
         
         # Check auth endpoints
-        auth_endpoints = API_ENDPOINTS["auth"]
-        assert "register" in auth_endpoints
-        assert "login" in auth_endpoints
-        assert "logout" in auth_endpoints
-        assert "me" in auth_endpoints
-        assert "change_password" in auth_endpoints
+        assert {"register", "login", "logout", "me", "change_password"} <= API_ENDPOINTS["auth"].keys()
         
         # Check that endpoints contain proper URLs
-        for category, endpoints in API_ENDPOINTS.items():
-            for endpoint_name, url in endpoints.items():
-                assert url.startswith("http://")
-                assert "/api/" in url
+        urls = [url for endpoints in API_ENDPOINTS.values() for url in endpoints.values()]
+        invalid_urls = [url for url in urls if not (url.startswith("http://") and "/api/" in url)]
+        assert invalid_urls == []
     
     def test_page_routing(self):
         """Test page routing logic."""
@@ -248,50 +311,22 @@ class TestFrontendIntegration:
         assert "dashboard" in expected_pages
 
 
+@pytest.mark.slow
 class TestFrontendComponents:
     """Test individual frontend components."""
     
-    def test_login_form_structure(self):
-        """Test login form structure."""
-        # This would test the login form components
-        # For now, we'll test that the structure is correct
-        
-        # Mock streamlit components
-        with patch('streamlit.form') as mock_form, \
-             patch('streamlit.text_input') as mock_text_input, \
-             patch('streamlit.form_submit_button') as mock_submit_button:
-            
-            # This is a placeholder test
-            # In a real implementation, we would test the actual form structure
-            assert True  # Placeholder assertion
-    
-    def test_dashboard_components(self):
-        """Test dashboard components."""
-        # This would test the dashboard components
-        # For now, we'll test that the structure is correct
+    @pytest.mark.parametrize("components", [
+        ("form", "text_input", "form_submit_button"),  # login form
+        ("title", "markdown", "columns"),  # dashboard
+        ("radio", "file_uploader", "text_area"),  # skills assessment
+    ], ids=["login_form", "dashboard", "skills_assessment"])
+    def test_component_structure(self, mocker, streamlit_module, components):
+        """Test that each page's Streamlit components can be mocked."""
+        mocker.patch.multiple(streamlit_module, **dict.fromkeys(components, mocker.DEFAULT))
         
-        # Mock streamlit components
-        with patch('streamlit.title') as mock_title, \
-             patch('streamlit.markdown') as mock_markdown, \
-             patch('streamlit.columns') as mock_columns:
-            
-            # This is a placeholder test
-            # In a real implementation, we would test the actual component structure
-            assert True  # Placeholder assertion
-    
-    def test_skills_assessment_components(self):
-        """Test skills assessment components."""
-        # This would test the skills assessment components
-        # For now, we'll test that the structure is correct
-        
-        # Mock streamlit components
-        with patch('streamlit.radio') as mock_radio, \
-             patch('streamlit.file_uploader') as mock_file_uploader, \
-             patch('streamlit.text_area') as mock_text_area:
-            
-            # This is a placeholder test
-            # In a real implementation, we would test the actual component structure
-            assert True  # Placeholder assertion
+        # This is a placeholder test
+        # In a real implementation, we would test the actual component structure
+        assert True  # Placeholder assertion
 
 
 if __name__ == "__main__":
@@ -8,10 +8,14 @@ and personalized learning experiences functionality.
 import pytest
 import json
 import uuid
+from collections import namedtuple
+from dataclasses import replace
 from datetime import datetime, timezone
-from unittest.mock import Mock, patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import Mock
 
 # Import the modules to test
+import backend.services.learning_engine as learning_engine_module
 from backend.services.learning_engine import (
     LearningEngine, LearningRecommendation, PersonalizedLearningPath,
     get_learning_engine
@@ -21,55 +25,125 @@ from backend.models.skills import SkillGap
 from backend.models.user import UserProfile, UserContext, UserPreferences, SkillLevel
 
 
+# Canned AI responses, serialised once at import
+AI_DEFAULT_RESPONSE = json.dumps({
+    "title": "Test Learning Content",
+    "learning_objectives": ["Learn test concepts", "Apply test knowledge"],
+    "content_structure": ["Introduction", "Main concepts", "Practice"],
+    "practical_exercises": ["Exercise 1", "Exercise 2"],
+    "key_takeaways": ["Key point 1", "Key point 2"],
+    "prerequisites": []
+})
+
+AI_PRIORITY_RESPONSE = json.dumps(["User Research", "React Native"])
+
+AI_FUNDAMENTALS_RESPONSE = json.dumps({
+    "title": "React Native Fundamentals",
+    "learning_objectives": ["Learn React Native basics", "Build a simple app"],
+    "content_structure": ["Introduction", "Components", "Navigation"],
+    "practical_exercises": ["Create a component", "Add navigation"],
+    "key_takeaways": ["React Native is powerful", "Cross-platform development"],
+    "prerequisites": ["JavaScript", "React"]
+})
+
+AI_COMPONENTS_RESPONSE = json.dumps({
+    "title": "React Native Components",
+    "learning_objectives": ["Understand components", "Create custom components"],
+    "content_structure": ["What are components", "Component lifecycle", "Best practices"],
+    "practical_exercises": ["Create a button component", "Style the component"],
+    "key_takeaways": ["Components are reusable", "Props make components flexible"],
+    "prerequisites": ["JavaScript basics"]
+})
+
+
+# learning_paths and learning_content rows as returned by the database
+PathRow = namedtuple(
+    "PathRow",
+    "id title description target_skills difficulty estimated_duration content_ids "
+    "prerequisites learning_objectives priority_order is_active created_at updated_at"
+)
+
+PATH_1_ROW = PathRow("path_1", "Test Path 1", "Description 1", '["React Native"]', "intermediate", 30, '["content_1"]', '[]', '["Learn React Native"]', '["React Native"]', "true", "2024-01-01T00:00:00", "2024-01-01T00:00:00")
+PATH_2_ROW = PathRow("path_2", "Test Path 2", "Description 2", '["User Research"]', "beginner", 20, '["content_2"]', '[]', '["Learn User Research"]', '["User Research"]', "true", "2024-01-01T00:00:00", "2024-01-01T00:00:00")
+CONTENT_1_ROW = ("content_1", "Test Content", "Description", "tutorial", "beginner", 15, '["React Native"]', '[]', '["Learn basics"]', None, "https://example.com", None, "content_text", None)
+CONTENT_2_ROW = ("content_2", "Test Content 2", "Description 2", "article", "beginner", 10, '["User Research"]', '[]', '["Learn basics"]', None, "https://example.com", None, "content_text", None)
+
+
+class StubAI:
+    """Minimal AI client returning a preset response, or raising a preset error."""
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self):
+        self.response = AI_DEFAULT_RESPONSE
+        self.raise_exc = None
+    
+    def generate_response(self, *args, **kwargs):
+        if self.raise_exc is not None:
+            raise self.raise_exc
+        return self.response
+
+
+# Shared defaults for recommendations; its lists must not be mutated
+_REC_TEMPLATE = LearningRecommendation(
+    content_id="x", title="Test", content_type="tutorial",
+    difficulty="beginner", estimated_duration=10, skills_covered=[],
+    priority_score=8.0, reasoning="", prerequisites=[], learning_objectives=[]
+)
+
+
+def make_rec(**overrides):
+    """Build a LearningRecommendation from the shared template."""
+    return replace(_REC_TEMPLATE, **overrides)
+
+
 class TestLearningEngine:
     """Test cases for the Learning Engine."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_dependencies(self):
-        """Mock all external dependencies."""
-        with patch('backend.services.learning_engine.get_database') as mock_db, \
-             patch('backend.services.learning_engine.get_vector_store') as mock_vector, \
-             patch('backend.services.learning_engine.get_ai_client') as mock_ai, \
-             patch('backend.services.learning_engine.get_config') as mock_config, \
-             patch('backend.services.learning_engine.SkillsEngine') as mock_skills_engine, \
-             patch('backend.services.learning_engine.UserService') as mock_user_service:
-            
-            # Setup mock database
-            mock_db_instance = Mock()
-            mock_db_instance.execute_query.return_value = []
-            mock_db_instance.execute_update.return_value = None
-            mock_db.return_value = mock_db_instance
-            
-            # Setup mock AI client
-            mock_ai_instance = Mock()
-            mock_ai_instance.generate_response.return_value = json.dumps({
-                "title": "Test Learning Content",
-                "learning_objectives": ["Learn test concepts", "Apply test knowledge"],
-                "content_structure": ["Introduction", "Main concepts", "Practice"],
-                "practical_exercises": ["Exercise 1", "Exercise 2"],
-                "key_takeaways": ["Key point 1", "Key point 2"],
-                "prerequisites": []
-            })
-            mock_ai.return_value = mock_ai_instance
-            
-            # Setup mock skills engine
-            mock_skills_instance = Mock()
-            mock_skills_instance.get_user_skill_gaps.return_value = []
-            mock_skills_engine.return_value = mock_skills_instance
-            
-            # Setup mock user service
-            mock_user_instance = Mock()
-            mock_user_instance.get_user_profile.return_value = None
-            mock_user_service.return_value = mock_user_instance
-            
-            yield {
-                'db': mock_db_instance,
-                'ai': mock_ai_instance,
-                'skills_engine': mock_skills_instance,
-                'user_service': mock_user_instance
-            }
+        """Mock all external dependencies once for the module."""
+        mocks = {
+            'db': Mock(),
+            'ai': StubAI(),
+            'skills_engine': Mock(),
+            'user_service': Mock()
+        }
+        vector_store, config = Mock(), Mock()
+        
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(learning_engine_module, 'get_database', lambda: mocks['db'])
+            mp.setattr(learning_engine_module, 'get_vector_store', lambda: vector_store)
+            mp.setattr(learning_engine_module, 'get_ai_client', lambda: mocks['ai'])
+            mp.setattr(learning_engine_module, 'get_config', lambda: config)
+            mp.setattr(learning_engine_module, 'SkillsEngine', lambda: mocks['skills_engine'])
+            mp.setattr(learning_engine_module, 'UserService', lambda: mocks['user_service'])
+            yield mocks
+    
+    @pytest.fixture(autouse=True)
+    def reset_mock_dependencies(self, mock_dependencies):
+        """Clear call history and per-test responses, then restore the defaults."""
+        for name in ('db', 'skills_engine', 'user_service'):
+            mock_dependencies[name].reset_mock(return_value=True, side_effect=True)
+        
+        # Setup mock database
+        mock_dependencies['db'].execute_query.return_value = []
+        mock_dependencies['db'].execute_update.return_value = None
+        
+        # Setup stub AI client
+        mock_dependencies['ai'].reset()
+        
+        # Setup mock skills engine and user service
+        mock_dependencies['skills_engine'].get_user_skill_gaps.return_value = []
+        mock_dependencies['user_service'].get_user_profile.return_value = None
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
+    def engine(self, mock_dependencies):
+        """Create one learning engine for the module, wired to the mocks."""
+        return LearningEngine()
+    
+    @pytest.fixture(scope="module")
     def sample_user_profile(self):
         """Create a sample user profile for testing."""
         return UserProfile(
@@ -81,18 +155,18 @@ class TestLearningEngine:
             industry="Technology",
             team_size=5,
             current_projects=[
-                Mock(name="Mobile App Project"),
-                Mock(name="Data Analytics Initiative")
+                SimpleNamespace(name="Mobile App Project"),
+                SimpleNamespace(name="Data Analytics Initiative")
             ],
             skills=[],
             preferences=UserPreferences(),
             context=UserContext(user_id="test_user_123")
         )
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_skill_gaps(self):
-        """Create sample skill gaps for testing."""
-        return [
+        """Create read-only sample skill gaps shared by the module."""
+        return (
             SkillGap(
                 id="gap_1",
                 user_id="test_user_123",
@@ -102,7 +176,7 @@ class TestLearningEngine:
                 gap_size=2.0,
                 category="technical_skills",
                 priority_score=8.5,
-                created_at=datetime.now(timezone.utc)
+                created_at=datetime(2024, 1, 1, tzinfo=timezone.utc)
             ),
             SkillGap(
                 id="gap_2",
@@ -113,14 +187,12 @@ class TestLearningEngine:
                 gap_size=1.5,
                 category="product_management",
                 priority_score=7.0,
-                created_at=datetime.now(timezone.utc)
+                created_at=datetime(2024, 1, 1, tzinfo=timezone.utc)
             )
-        ]
+        )
     
-    def test_learning_engine_initialization(self, mock_dependencies):
+    def test_learning_engine_initialization(self, engine):
         """Test learning engine initialization."""
-        engine = LearningEngine()
-        
         assert engine is not None
         assert engine.content_categories is not None
         assert "product_management" in engine.content_categories
@@ -130,7 +202,7 @@ class TestLearningEngine:
         assert "quick_tip" in engine.micro_learning_duration
     
     def test_generate_personalized_learning_path_with_skill_gaps(
-        self, mock_dependencies, sample_user_profile, sample_skill_gaps
+        self, engine, mock_dependencies, sample_user_profile, sample_skill_gaps
     ):
         """Test learning path generation with skill gaps."""
         # Setup mocks
@@ -140,8 +212,6 @@ class TestLearningEngine:
         # Mock database queries for content search
         mock_dependencies['db'].execute_query.return_value = []
         
-        engine = LearningEngine()
-        
         # Generate learning path
         learning_path = engine.generate_personalized_learning_path("test_user_123")
         
@@ -155,15 +225,13 @@ class TestLearningEngine:
         assert learning_path.created_at is not None
     
     def test_generate_personalized_learning_path_no_skill_gaps(
-        self, mock_dependencies, sample_user_profile
+        self, engine, mock_dependencies, sample_user_profile
     ):
         """Test learning path generation when no skill gaps exist."""
         # Setup mocks
         mock_dependencies['user_service'].get_user_profile.return_value = sample_user_profile
         mock_dependencies['skills_engine'].get_user_skill_gaps.return_value = []
         
-        engine = LearningEngine()
-        
         # Generate learning path
         learning_path = engine.generate_personalized_learning_path("test_user_123")
         
@@ -173,25 +241,19 @@ class TestLearningEngine:
         assert learning_path.content_sequence is not None
         assert len(learning_path.content_sequence) > 0
     
-    def test_generate_personalized_learning_path_user_not_found(self, mock_dependencies):
+    def test_generate_personalized_learning_path_user_not_found(self, engine, mock_dependencies):
         """Test learning path generation when user is not found."""
         # Setup mocks
         mock_dependencies['user_service'].get_user_profile.return_value = None
         
-        engine = LearningEngine()
-        
         # Should raise ValueError
         with pytest.raises(ValueError, match="User profile not found"):
             engine.generate_personalized_learning_path("nonexistent_user")
     
-    def test_prioritize_skill_gaps(self, mock_dependencies, sample_user_profile, sample_skill_gaps):
+    def test_prioritize_skill_gaps(self, engine, mock_dependencies, sample_user_profile, sample_skill_gaps):
         """Test skill gap prioritization."""
         # Setup mocks
-        mock_dependencies['ai'].generate_response.return_value = json.dumps([
-            "User Research", "React Native"
-        ])
-        
-        engine = LearningEngine()
+        mock_dependencies['ai'].response = AI_PRIORITY_RESPONSE
         
         # Test prioritization
         prioritized_gaps = engine._prioritize_skill_gaps(sample_skill_gaps, sample_user_profile)
@@ -201,12 +263,10 @@ class TestLearningEngine:
         assert prioritized_gaps[0].skill_name == "User Research"
         assert prioritized_gaps[1].skill_name == "React Native"
     
-    def test_prioritize_skill_gaps_ai_failure(self, mock_dependencies, sample_user_profile, sample_skill_gaps):
+    def test_prioritize_skill_gaps_ai_failure(self, engine, mock_dependencies, sample_user_profile, sample_skill_gaps):
         """Test skill gap prioritization when AI fails."""
         # Setup mocks to simulate AI failure
-        mock_dependencies['ai'].generate_response.side_effect = Exception("AI service unavailable")
-        
-        engine = LearningEngine()
+        mock_dependencies['ai'].raise_exc = Exception("AI service unavailable")
         
         # Should fallback to gap size priority
         prioritized_gaps = engine._prioritize_skill_gaps(sample_skill_gaps, sample_user_profile)
@@ -216,20 +276,11 @@ class TestLearningEngine:
         # Should be sorted by gap size (descending)
         assert prioritized_gaps[0].gap_size >= prioritized_gaps[1].gap_size
     
-    def test_get_content_for_skill_gap(self, mock_dependencies, sample_user_profile, sample_skill_gaps):
+    def test_get_content_for_skill_gap(self, engine, mock_dependencies, sample_user_profile, sample_skill_gaps):
         """Test content retrieval for a specific skill gap."""
         # Setup mocks
         mock_dependencies['db'].execute_query.return_value = []
-        mock_dependencies['ai'].generate_response.return_value = json.dumps({
-            "title": "React Native Fundamentals",
-            "learning_objectives": ["Learn React Native basics", "Build a simple app"],
-            "content_structure": ["Introduction", "Components", "Navigation"],
-            "practical_exercises": ["Create a component", "Add navigation"],
-            "key_takeaways": ["React Native is powerful", "Cross-platform development"],
-            "prerequisites": ["JavaScript", "React"]
-        })
-        
-        engine = LearningEngine()
+        mock_dependencies['ai'].response = AI_FUNDAMENTALS_RESPONSE
         
         # Test content generation
         recommendations = engine._get_content_for_skill_gap(
@@ -243,7 +294,7 @@ class TestLearningEngine:
         assert recommendations[0].skills_covered is not None
         assert "React Native" in recommendations[0].skills_covered
     
-    def test_search_existing_content(self, mock_dependencies):
+    def test_search_existing_content(self, engine, mock_dependencies):
         """Test searching for existing content."""
         # Setup mock database response
         mock_dependencies['db'].execute_query.return_value = [
@@ -255,8 +306,6 @@ class TestLearningEngine:
             )
         ]
         
-        engine = LearningEngine()
-        
         # Test content search
         content_list = engine._search_existing_content("React Native", "beginner")
         
@@ -266,19 +315,10 @@ class TestLearningEngine:
         assert content_list[0]['title'] == "React Native Basics"
         assert content_list[0]['skills_covered'] == ["React Native", "Mobile Development"]
     
-    def test_generate_micro_learning_content(self, mock_dependencies, sample_user_profile, sample_skill_gaps):
+    def test_generate_micro_learning_content(self, engine, mock_dependencies, sample_user_profile, sample_skill_gaps):
         """Test micro-learning content generation."""
         # Setup mocks
-        mock_dependencies['ai'].generate_response.return_value = json.dumps({
-            "title": "React Native Components",
-            "learning_objectives": ["Understand components", "Create custom components"],
-            "content_structure": ["What are components", "Component lifecycle", "Best practices"],
-            "practical_exercises": ["Create a button component", "Style the component"],
-            "key_takeaways": ["Components are reusable", "Props make components flexible"],
-            "prerequisites": ["JavaScript basics"]
-        })
-        
-        engine = LearningEngine()
+        mock_dependencies['ai'].response = AI_COMPONENTS_RESPONSE
         
         # Test content generation
         content_list = engine._generate_micro_learning_content(
@@ -294,30 +334,28 @@ class TestLearningEngine:
         assert content['estimated_duration'] > 0
         assert content['skills_covered'] == ["React Native"]
     
-    def test_select_content_type(self, mock_dependencies):
+    @pytest.mark.parametrize("skill, level, expected", [
+        ("programming", "beginner", "tutorial"),
+        ("data_analysis", "intermediate", "practical_exercise"),
+        ("user_research", "advanced", "case_study"),
+        ("unknown_skill", "beginner", "concept_explanation"),
+    ])
+    def test_select_content_type(self, engine, skill, level, expected):
         """Test content type selection."""
-        engine = LearningEngine()
-        
-        # Test various skill mappings
-        assert engine._select_content_type("programming", "beginner") == "tutorial"
-        assert engine._select_content_type("data_analysis", "intermediate") == "practical_exercise"
-        assert engine._select_content_type("user_research", "advanced") == "case_study"
-        assert engine._select_content_type("unknown_skill", "beginner") == "concept_explanation"
+        assert engine._select_content_type(skill, level) == expected
     
-    def test_determine_difficulty_level(self, mock_dependencies):
+    @pytest.mark.parametrize("current, target, expected", [
+        ("beginner", "intermediate", "intermediate"),
+        ("beginner", "advanced", "advanced"),
+        ("intermediate", "advanced", "intermediate"),
+        ("advanced", "expert", "beginner"),
+    ])
+    def test_determine_difficulty_level(self, engine, current, target, expected):
         """Test difficulty level determination."""
-        engine = LearningEngine()
-        
-        # Test various level combinations
-        assert engine._determine_difficulty_level("beginner", "intermediate") == "intermediate"
-        assert engine._determine_difficulty_level("beginner", "advanced") == "advanced"
-        assert engine._determine_difficulty_level("intermediate", "advanced") == "intermediate"
-        assert engine._determine_difficulty_level("advanced", "expert") == "beginner"
+        assert engine._determine_difficulty_level(current, target) == expected
     
-    def test_calculate_priority_score(self, mock_dependencies, sample_user_profile, sample_skill_gaps):
+    def test_calculate_priority_score(self, engine, sample_user_profile, sample_skill_gaps):
         """Test priority score calculation."""
-        engine = LearningEngine()
-        
         content = {
             'estimated_duration': 10,
             'difficulty': 'intermediate',
@@ -329,22 +367,13 @@ class TestLearningEngine:
         assert score > 0
         assert isinstance(score, float)
     
-    def test_create_personalized_path(self, mock_dependencies, sample_user_profile, sample_skill_gaps):
+    def test_create_personalized_path(self, engine, sample_user_profile, sample_skill_gaps):
         """Test personalized path creation."""
-        engine = LearningEngine()
-        
         # Create sample recommendations
         recommendations = [
-            LearningRecommendation(
-                content_id="rec_1",
-                title="Test Content 1",
-                content_type="tutorial",
-                difficulty="beginner",
-                estimated_duration=15,
-                skills_covered=["React Native"],
-                priority_score=8.0,
-                reasoning="Test reasoning",
-                prerequisites=[],
+            make_rec(
+                content_id="rec_1", title="Test Content 1", estimated_duration=15,
+                skills_covered=["React Native"], reasoning="Test reasoning",
                 learning_objectives=["Learn basics"]
             )
         ]
@@ -362,26 +391,12 @@ class TestLearningEngine:
         assert learning_path.estimated_duration == 15
         assert learning_path.success_metrics is not None
     
-    def test_calculate_difficulty_distribution(self, mock_dependencies):
+    def test_calculate_difficulty_distribution(self, engine):
         """Test difficulty distribution calculation."""
-        engine = LearningEngine()
-        
         recommendations = [
-            LearningRecommendation(
-                content_id="rec_1", title="Test 1", content_type="tutorial",
-                difficulty="beginner", estimated_duration=10, skills_covered=[],
-                priority_score=8.0, reasoning="", prerequisites=[], learning_objectives=[]
-            ),
-            LearningRecommendation(
-                content_id="rec_2", title="Test 2", content_type="tutorial",
-                difficulty="intermediate", estimated_duration=15, skills_covered=[],
-                priority_score=7.0, reasoning="", prerequisites=[], learning_objectives=[]
-            ),
-            LearningRecommendation(
-                content_id="rec_3", title="Test 3", content_type="tutorial",
-                difficulty="beginner", estimated_duration=12, skills_covered=[],
-                priority_score=6.0, reasoning="", prerequisites=[], learning_objectives=[]
-            )
+            make_rec(content_id="rec_1", difficulty="beginner"),
+            make_rec(content_id="rec_2", difficulty="intermediate"),
+            make_rec(content_id="rec_3", difficulty="beginner")
         ]
         
         distribution = engine._calculate_difficulty_distribution(recommendations)
@@ -391,79 +406,48 @@ class TestLearningEngine:
         assert distribution["advanced"] == 0
         assert distribution["expert"] == 0
     
-    def test_determine_overall_difficulty(self, mock_dependencies):
+    @pytest.mark.parametrize("difficulties, expected", [
+        (["beginner"], "beginner"),
+        (["beginner", "intermediate"], "intermediate"),
+    ], ids=["beginner", "mixed"])
+    def test_determine_overall_difficulty(self, engine, difficulties, expected):
         """Test overall difficulty determination."""
-        engine = LearningEngine()
-        
-        # Test with beginner content
-        beginner_recs = [
-            LearningRecommendation(
-                content_id="rec_1", title="Test 1", content_type="tutorial",
-                difficulty="beginner", estimated_duration=10, skills_covered=[],
-                priority_score=8.0, reasoning="", prerequisites=[], learning_objectives=[]
-            )
-        ]
-        assert engine._determine_overall_difficulty(beginner_recs) == "beginner"
-        
-        # Test with mixed content
-        mixed_recs = [
-            LearningRecommendation(
-                content_id="rec_1", title="Test 1", content_type="tutorial",
-                difficulty="beginner", estimated_duration=10, skills_covered=[],
-                priority_score=8.0, reasoning="", prerequisites=[], learning_objectives=[]
-            ),
-            LearningRecommendation(
-                content_id="rec_2", title="Test 2", content_type="tutorial",
-                difficulty="intermediate", estimated_duration=15, skills_covered=[],
-                priority_score=7.0, reasoning="", prerequisites=[], learning_objectives=[]
-            )
-        ]
-        assert engine._determine_overall_difficulty(mixed_recs) == "intermediate"
+        recommendations = [make_rec(content_id=f"rec_{i}", difficulty=difficulty) for i, difficulty in enumerate(difficulties, 1)]
+        
+        assert engine._determine_overall_difficulty(recommendations) == expected
     
-    def test_get_learning_path(self, mock_dependencies):
-        """Test getting a learning path by ID."""
+    @pytest.mark.parametrize("query_results,expected_id", [
+        ([[PATH_1_ROW], [CONTENT_1_ROW]], "path_1"),
+        ([[]], None),
+    ], ids=["found", "not_found"])
+    def test_get_learning_path(self, engine, mock_dependencies, query_results, expected_id):
+        """Test getting a learning path by ID, including a missing one."""
         # Setup mock database response
-        mock_dependencies['db'].execute_query.side_effect = [
-            [("path_1", "Test Path", "Test Description", '["React Native"]', "intermediate", 30, '["content_1"]', '[]', '["Learn React Native"]', '["React Native"]', "true", "2024-01-01T00:00:00", "2024-01-01T00:00:00")],
-            [("content_1", "Test Content", "Test Description", "tutorial", "beginner", 15, '["React Native"]', '[]', '["Learn basics"]', None, "https://example.com", None, "content_text", None)]
-        ]
-        
-        engine = LearningEngine()
+        mock_dependencies['db'].execute_query.side_effect = query_results
         
         # Test getting learning path
-        learning_path = engine.get_learning_path("path_1")
+        learning_path = engine.get_learning_path(expected_id or "nonexistent_path")
         
-        assert learning_path is not None
-        assert learning_path.path_id == "path_1"
-        assert learning_path.title == "Test Path"
+        if expected_id is None:
+            assert learning_path is None
+            return
+        
+        assert learning_path.path_id == expected_id
+        assert learning_path.title == PATH_1_ROW.title
         assert learning_path.target_skills == ["React Native"]
         assert len(learning_path.content_sequence) == 1
     
-    def test_get_learning_path_not_found(self, mock_dependencies):
-        """Test getting a learning path that doesn't exist."""
-        # Setup mock database response
-        mock_dependencies['db'].execute_query.return_value = []
-        
-        engine = LearningEngine()
-        
-        # Test getting non-existent learning path
-        learning_path = engine.get_learning_path("nonexistent_path")
-        
-        assert learning_path is None
-    
-    def test_get_user_learning_paths(self, mock_dependencies):
+    def test_get_user_learning_paths(self, engine, mock_dependencies):
         """Test getting all learning paths for a user."""
         # Setup mock database response
         mock_dependencies['db'].execute_query.side_effect = [
             [("path_1",), ("path_2",)],  # First query for path IDs
-            [("path_1", "Test Path 1", "Description 1", '["React Native"]', "intermediate", 30, '["content_1"]', '[]', '["Learn React Native"]', '["React Native"]', "true", "2024-01-01T00:00:00", "2024-01-01T00:00:00")],  # Second query for path 1
-            [("content_1", "Test Content", "Description", "tutorial", "beginner", 15, '["React Native"]', '[]', '["Learn basics"]', None, "https://example.com", None, "content_text", None)],  # Third query for content
-            [("path_2", "Test Path 2", "Description 2", '["User Research"]', "beginner", 20, '["content_2"]', '[]', '["Learn User Research"]', '["User Research"]', "true", "2024-01-01T00:00:00", "2024-01-01T00:00:00")],  # Fourth query for path 2
-            [("content_2", "Test Content 2", "Description 2", "article", "beginner", 10, '["User Research"]', '[]', '["Learn basics"]', None, "https://example.com", None, "content_text", None)]  # Fifth query for content 2
+            [PATH_1_ROW],  # Second query for path 1
+            [CONTENT_1_ROW],  # Third query for content
+            [PATH_2_ROW],  # Fourth query for path 2
+            [CONTENT_2_ROW]  # Fifth query for content 2
         ]
         
-        engine = LearningEngine()
-        
         # Test getting user learning paths
         learning_paths = engine.get_user_learning_paths("test_user_123")
         
@@ -472,10 +456,8 @@ class TestLearningEngine:
         assert learning_paths[0].path_id == "path_1"
         assert learning_paths[1].path_id == "path_2"
     
-    def test_format_content_text(self, mock_dependencies):
+    def test_format_content_text(self, engine):
         """Test content text formatting."""
-        engine = LearningEngine()
-        
         content_data = {
             "title": "Test Learning Module",
             "learning_objectives": ["Objective 1", "Objective 2"],
@@ -495,11 +477,10 @@ class TestLearningEngine:
         assert "## Practical Exercises" in formatted_text
         assert "## Key Takeaways" in formatted_text
     
-    def test_global_learning_engine_instance(self, mock_dependencies):
+    def test_global_learning_engine_instance(self, mock_dependencies, monkeypatch):
         """Test global learning engine instance."""
-        # Clear any existing instance
-        import backend.services.learning_engine
-        backend.services.learning_engine._learning_engine = None
+        # Clear any existing instance; the original is restored afterwards
+        monkeypatch.setattr(learning_engine_module, '_learning_engine', None)
         
         # Get instance
         engine1 = get_learning_engine()
@@ -545,13 +526,7 @@ class TestPersonalizedLearningPath:
     
     def test_personalized_learning_path_creation(self):
         """Test PersonalizedLearningPath creation."""
-        recommendations = [
-            LearningRecommendation(
-                content_id="rec_1", title="Test 1", content_type="tutorial",
-                difficulty="beginner", estimated_duration=10, skills_covered=[],
-                priority_score=8.0, reasoning="", prerequisites=[], learning_objectives=[]
-            )
-        ]
+        recommendations = [make_rec(content_id="rec_1", title="Test 1")]
         
         path = PersonalizedLearningPath(
             path_id="test_path_123",
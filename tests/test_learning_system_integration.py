@@ -7,24 +7,177 @@ learning engine, API endpoints, and database operations.
 
 import pytest
 import json
+import re
 import uuid
+from operator import attrgetter
 from datetime import datetime, timezone
-from unittest.mock import Mock, patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import Mock, MagicMock
 
 # Import the modules to test
-from backend.services.learning_engine import get_learning_engine, LearningEngine
+from backend.database import connection as connection_module
+from backend.database import vector_store as vector_store_module
+from backend.database.connection import DatabaseConnection
+from backend.services import user_context_builder as user_context_builder_module
+from backend.services.learning_engine import (
+    LearningEngine, LearningRecommendation, PersonalizedLearningPath
+)
 from backend.models.learning import LearningContentCreate, ContentType, DifficultyLevel
 from backend.models.skills import SkillGap
 from backend.models.user import UserProfile, UserContext, UserPreferences, SkillLevel
 
 
+# Read-only recommendation stand-ins; only their difficulty is inspected
+BEGINNER = SimpleNamespace(difficulty="beginner")
+INTERMEDIATE = SimpleNamespace(difficulty="intermediate")
+ADVANCED = SimpleNamespace(difficulty="advanced")
+EXPERT = SimpleNamespace(difficulty="expert")
+
+# Deterministic timestamp for model fixtures
+FIXED_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+# Model constructor arguments and the attributes each should expose
+LEARNING_CONTENT_KWARGS = dict(
+    title="Test Learning Content",
+    description="A test piece of learning content",
+    content_type=ContentType.TUTORIAL,
+    difficulty=DifficultyLevel.INTERMEDIATE,
+    estimated_duration=15,
+    skills_covered=["React Native", "Mobile Development"],
+    prerequisites=["JavaScript", "React"],
+    learning_objectives=["Learn React Native basics", "Build a mobile app"],
+    content_text="This is the content text...",
+    tags=["mobile", "react", "development"]
+)
+
+SKILL_GAP_KWARGS = dict(
+    id="gap_1",
+    user_id="test_user_123",
+    skill_name="React Native",
+    current_level=SkillLevel.BEGINNER,
+    target_level=SkillLevel.INTERMEDIATE,
+    gap_size=2.0,
+    category="technical_skills",
+    priority_score=8.5,
+    created_at=FIXED_NOW
+)
+
+# Default-valued profile sub-models, validated once and never mutated
+DEFAULT_PREFERENCES = UserPreferences()
+DEFAULT_CONTEXT = UserContext(user_id="test_user_123")
+
+USER_PROFILE_KWARGS = dict(
+    id="test_user_123",
+    username="testuser",
+    email="test@example.com",
+    current_role="Product Manager",
+    years_of_experience=3,
+    industry="Technology",
+    team_size=5,
+    current_projects=[
+        SimpleNamespace(name="Mobile App Project"),
+        SimpleNamespace(name="Data Analytics Initiative")
+    ],
+    skills=[],
+    preferences=DEFAULT_PREFERENCES,
+    context=DEFAULT_CONTEXT
+)
+
+MODEL_CASES = [
+    pytest.param(LearningContentCreate, LEARNING_CONTENT_KWARGS, {
+        "title": "Test Learning Content",
+        "content_type": ContentType.TUTORIAL,
+        "difficulty": DifficultyLevel.INTERMEDIATE,
+        "estimated_duration": 15,
+        "skills_covered": ["React Native", "Mobile Development"],
+        "prerequisites": ["JavaScript", "React"],
+        "learning_objectives": ["Learn React Native basics", "Build a mobile app"],
+        "tags": ["mobile", "react", "development"]
+    }, id="learning_content"),
+    pytest.param(SkillGap, SKILL_GAP_KWARGS, {
+        "id": "gap_1",
+        "user_id": "test_user_123",
+        "skill_name": "React Native",
+        "current_level": SkillLevel.BEGINNER,
+        "target_level": SkillLevel.INTERMEDIATE,
+        "gap_size": 2.0,
+        "category": "technical_skills",
+        "priority_score": 8.5,
+        "created_at": FIXED_NOW
+    }, id="skill_gap"),
+    pytest.param(UserProfile, USER_PROFILE_KWARGS, {
+        "id": "test_user_123",
+        "username": "testuser",
+        "email": "test@example.com",
+        "current_role": "Product Manager",
+        "years_of_experience": 3,
+        "industry": "Technology",
+        "team_size": 5,
+        "current_projects": USER_PROFILE_KWARGS["current_projects"],
+        "context.user_id": DEFAULT_CONTEXT.user_id
+    }, id="user_profile"),
+]
+
+# Markers the formatted content text must contain, found in a single scan
+FORMATTED_TEXT_MARKERS = (
+    "# Test Learning Module",
+    "## Learning Objectives",
+    "- Objective 1",
+    "## Content Structure",
+    "1. Step 1",
+    "## Practical Exercises",
+    "## Key Takeaways"
+)
+FORMATTED_TEXT_PATTERN = re.compile("|".join(map(re.escape, FORMATTED_TEXT_MARKERS)))
+
+# Canned AI response, serialised once at import
+AI_COMPONENTS_RESPONSE = json.dumps({
+    "title": "React Native Components",
+    "learning_objectives": ["Understand components", "Create custom components"],
+    "content_structure": ["What are components", "Component lifecycle", "Best practices"],
+    "practical_exercises": ["Create a button component", "Style the component"],
+    "key_takeaways": ["Components are reusable", "Props make components flexible"],
+    "prerequisites": ["JavaScript basics"]
+})
+
+
 class TestLearningSystemIntegration:
     """Integration tests for the complete learning system."""
     
-    def test_learning_engine_initialization(self):
-        """Test that the learning engine initializes correctly."""
-        engine = get_learning_engine()
+    @pytest.fixture(scope="class")
+    def engine(self, tmp_path_factory, vector_store):
+        """
+        Build a learning engine once for the class.
         
+        The engine and the services it creates run against a temporary
+        database and the in-memory vector store, so nothing is written to
+        the committed data directory.
+        """
+        db = DatabaseConnection(str(tmp_path_factory.mktemp("learning") / "test.db"))
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(connection_module, '_db_instance', db)
+            mp.setattr(vector_store_module, '_vector_store_instance', vector_store)
+            mp.setattr(user_context_builder_module, '_context_builder_instance', None)
+            yield LearningEngine()
+    
+    @pytest.fixture(scope="module")
+    def sample_recommendation(self):
+        """Create one read-only recommendation shared by the module."""
+        return LearningRecommendation(
+            content_id="test_content_123",
+            title="Test Learning Content",
+            content_type="tutorial",
+            difficulty="intermediate",
+            estimated_duration=15,
+            skills_covered=["React Native", "Mobile Development"],
+            priority_score=8.5,
+            reasoning="High priority for current project",
+            prerequisites=["JavaScript", "React"],
+            learning_objectives=["Learn React Native basics", "Build a mobile app"]
+        )
+    
+    def test_learning_engine_initialization(self, engine):
+        """Test that the learning engine initializes correctly."""
         assert engine is not None
         assert hasattr(engine, 'content_categories')
         assert hasattr(engine, 'micro_learning_duration')
@@ -37,34 +190,31 @@ class TestLearningSystemIntegration:
         assert engine.micro_learning_duration['tutorial'] == 15
         assert engine.micro_learning_duration['practical_exercise'] == 15
     
-    def test_content_type_selection(self):
+    @pytest.mark.parametrize("skill, level, expected", [
+        ("programming", "beginner", "tutorial"),
+        ("data_analysis", "intermediate", "practical_exercise"),
+        ("user_research", "advanced", "case_study"),
+        ("unknown_skill", "beginner", "concept_explanation"),
+    ])
+    def test_content_type_selection(self, engine, skill, level, expected):
         """Test content type selection logic."""
-        engine = get_learning_engine()
-        
-        # Test various skill mappings
-        assert engine._select_content_type("programming", "beginner") == "tutorial"
-        assert engine._select_content_type("data_analysis", "intermediate") == "practical_exercise"
-        assert engine._select_content_type("user_research", "advanced") == "case_study"
-        assert engine._select_content_type("unknown_skill", "beginner") == "concept_explanation"
+        assert engine._select_content_type(skill, level) == expected
     
-    def test_difficulty_level_determination(self):
+    @pytest.mark.parametrize("current, target, expected", [
+        ("beginner", "intermediate", "intermediate"),
+        ("beginner", "advanced", "advanced"),
+        ("intermediate", "advanced", "intermediate"),
+        ("advanced", "expert", "beginner"),
+    ])
+    def test_difficulty_level_determination(self, engine, current, target, expected):
         """Test difficulty level determination logic."""
-        engine = get_learning_engine()
-        
-        # Test various level combinations
-        assert engine._determine_difficulty_level("beginner", "intermediate") == "intermediate"
-        assert engine._determine_difficulty_level("beginner", "advanced") == "advanced"
-        assert engine._determine_difficulty_level("intermediate", "advanced") == "intermediate"
-        assert engine._determine_difficulty_level("advanced", "expert") == "beginner"
+        assert engine._determine_difficulty_level(current, target) == expected
     
-    def test_priority_score_calculation(self):
+    def test_priority_score_calculation(self, engine):
         """Test priority score calculation logic."""
-        engine = get_learning_engine()
-        
-        # Create mock objects
-        mock_user_profile = Mock()
-        mock_skill_gap = Mock()
-        mock_skill_gap.gap_size = 2.0
+        # Create stand-in objects
+        user_profile = SimpleNamespace()
+        skill_gap = SimpleNamespace(gap_size=2.0)
         
         content = {
             'estimated_duration': 10,
@@ -72,24 +222,16 @@ class TestLearningSystemIntegration:
             'content_type': 'tutorial'
         }
         
-        score = engine._calculate_priority_score(content, mock_skill_gap, mock_user_profile)
+        score = engine._calculate_priority_score(content, skill_gap, user_profile)
         
         assert score > 0
         assert isinstance(score, float)
         # Should include gap size (20) + duration bonus (5) + difficulty bonus (3) + content type bonus (2)
         assert score >= 20  # At least the gap size contribution
     
-    def test_difficulty_distribution_calculation(self):
+    def test_difficulty_distribution_calculation(self, engine):
         """Test difficulty distribution calculation."""
-        engine = get_learning_engine()
-        
-        # Create mock recommendations
-        recommendations = [
-            Mock(difficulty="beginner"),
-            Mock(difficulty="intermediate"),
-            Mock(difficulty="beginner"),
-            Mock(difficulty="advanced")
-        ]
+        recommendations = [BEGINNER, INTERMEDIATE, BEGINNER, ADVANCED]
         
         distribution = engine._calculate_difficulty_distribution(recommendations)
         
@@ -98,32 +240,17 @@ class TestLearningSystemIntegration:
         assert distribution["advanced"] == 1
         assert distribution["expert"] == 0
     
-    def test_overall_difficulty_determination(self):
+    @pytest.mark.parametrize("recommendations, expected", [
+        ([BEGINNER], "beginner"),
+        ([BEGINNER, INTERMEDIATE], "intermediate"),
+        ([ADVANCED, EXPERT], "advanced"),
+    ], ids=["beginner", "mixed", "advanced"])
+    def test_overall_difficulty_determination(self, engine, recommendations, expected):
         """Test overall difficulty determination."""
-        engine = get_learning_engine()
-        
-        # Test with beginner content
-        beginner_recs = [Mock(difficulty="beginner")]
-        assert engine._determine_overall_difficulty(beginner_recs) == "beginner"
-        
-        # Test with mixed content
-        mixed_recs = [
-            Mock(difficulty="beginner"),
-            Mock(difficulty="intermediate")
-        ]
-        assert engine._determine_overall_difficulty(mixed_recs) == "intermediate"
-        
-        # Test with advanced content
-        advanced_recs = [
-            Mock(difficulty="advanced"),
-            Mock(difficulty="expert")
-        ]
-        assert engine._determine_overall_difficulty(advanced_recs) == "advanced"
+        assert engine._determine_overall_difficulty(recommendations) == expected
     
-    def test_content_text_formatting(self):
+    def test_content_text_formatting(self, engine):
         """Test content text formatting."""
-        engine = get_learning_engine()
-        
         content_data = {
             "title": "Test Learning Module",
             "learning_objectives": ["Objective 1", "Objective 2"],
@@ -135,30 +262,16 @@ class TestLearningSystemIntegration:
         
         formatted_text = engine._format_content_text(content_data)
         
-        assert "# Test Learning Module" in formatted_text
-        assert "## Learning Objectives" in formatted_text
-        assert "- Objective 1" in formatted_text
-        assert "## Content Structure" in formatted_text
-        assert "1. Step 1" in formatted_text
-        assert "## Practical Exercises" in formatted_text
-        assert "## Key Takeaways" in formatted_text
+        assert set(FORMATTED_TEXT_PATTERN.findall(formatted_text)) == set(FORMATTED_TEXT_MARKERS)
     
-    @patch('backend.services.learning_engine.get_ai_client')
-    def test_micro_learning_content_generation(self, mock_ai_client):
+    def test_micro_learning_content_generation(self, engine, monkeypatch):
         """Test micro-learning content generation with AI."""
         # Setup mock AI client
         mock_ai_instance = Mock()
-        mock_ai_instance.generate_response.return_value = json.dumps({
-            "title": "React Native Components",
-            "learning_objectives": ["Understand components", "Create custom components"],
-            "content_structure": ["What are components", "Component lifecycle", "Best practices"],
-            "practical_exercises": ["Create a button component", "Style the component"],
-            "key_takeaways": ["Components are reusable", "Props make components flexible"],
-            "prerequisites": ["JavaScript basics"]
-        })
-        mock_ai_client.return_value = mock_ai_instance
-        
-        engine = get_learning_engine()
+        mock_ai_instance.generate_response.return_value = AI_COMPONENTS_RESPONSE
+        monkeypatch.setattr(engine, 'ai_client', mock_ai_instance)
+        mock_store = Mock()
+        monkeypatch.setattr(engine, '_store_generated_content', mock_store)
         
         # Create mock objects
         mock_user_profile = Mock()
@@ -179,23 +292,11 @@ class TestLearningSystemIntegration:
         assert content['estimated_duration'] > 0
         assert content['skills_covered'] == ["React Native"]
         assert content['learning_objectives'] == ["Understand components", "Create custom components"]
+        mock_store.assert_called_once_with(content)
     
-    def test_learning_recommendation_creation(self):
+    def test_learning_recommendation_creation(self, sample_recommendation):
         """Test learning recommendation creation."""
-        from backend.services.learning_engine import LearningRecommendation
-        
-        rec = LearningRecommendation(
-            content_id="test_content_123",
-            title="Test Learning Content",
-            content_type="tutorial",
-            difficulty="intermediate",
-            estimated_duration=15,
-            skills_covered=["React Native", "Mobile Development"],
-            priority_score=8.5,
-            reasoning="High priority for current project",
-            prerequisites=["JavaScript", "React"],
-            learning_objectives=["Learn React Native basics", "Build a mobile app"]
-        )
+        rec = sample_recommendation
         
         assert rec.content_id == "test_content_123"
         assert rec.title == "Test Learning Content"
@@ -208,17 +309,9 @@ class TestLearningSystemIntegration:
         assert rec.prerequisites == ["JavaScript", "React"]
         assert rec.learning_objectives == ["Learn React Native basics", "Build a mobile app"]
     
-    def test_personalized_learning_path_creation(self):
+    def test_personalized_learning_path_creation(self, sample_recommendation):
         """Test personalized learning path creation."""
-        from backend.services.learning_engine import PersonalizedLearningPath, LearningRecommendation
-        
-        recommendations = [
-            LearningRecommendation(
-                content_id="rec_1", title="Test 1", content_type="tutorial",
-                difficulty="beginner", estimated_duration=10, skills_covered=[],
-                priority_score=8.0, reasoning="", prerequisites=[], learning_objectives=[]
-            )
-        ]
+        recommendations = [sample_recommendation]
         
         path = PersonalizedLearningPath(
             path_id="test_path_123",
@@ -232,7 +325,7 @@ class TestLearningSystemIntegration:
             learning_objectives=["Learn React Native", "Improve user research skills"],
             priority_order=["React Native", "User Research"],
             success_metrics={"completion_rate": 0.8, "satisfaction": 4.5},
-            created_at=datetime.now(timezone.utc)
+            created_at=FIXED_NOW
         )
         
         assert path.path_id == "test_path_123"
@@ -248,83 +341,13 @@ class TestLearningSystemIntegration:
         assert path.success_metrics == {"completion_rate": 0.8, "satisfaction": 4.5}
         assert path.created_at is not None
     
-    def test_learning_content_model_validation(self):
-        """Test learning content model validation."""
-        content = LearningContentCreate(
-            title="Test Learning Content",
-            description="A test piece of learning content",
-            content_type=ContentType.TUTORIAL,
-            difficulty=DifficultyLevel.INTERMEDIATE,
-            estimated_duration=15,
-            skills_covered=["React Native", "Mobile Development"],
-            prerequisites=["JavaScript", "React"],
-            learning_objectives=["Learn React Native basics", "Build a mobile app"],
-            content_text="This is the content text...",
-            tags=["mobile", "react", "development"]
-        )
+    @pytest.mark.parametrize("model_class,kwargs,expected", MODEL_CASES)
+    def test_model_validation(self, model_class, kwargs, expected):
+        """Test that the learning, skill gap and user profile models validate."""
+        instance = model_class(**kwargs)
         
-        assert content.title == "Test Learning Content"
-        assert content.content_type == ContentType.TUTORIAL
-        assert content.difficulty == DifficultyLevel.INTERMEDIATE
-        assert content.estimated_duration == 15
-        assert content.skills_covered == ["React Native", "Mobile Development"]
-        assert content.prerequisites == ["JavaScript", "React"]
-        assert content.learning_objectives == ["Learn React Native basics", "Build a mobile app"]
-        assert content.tags == ["mobile", "react", "development"]
-    
-    def test_skill_gap_model_validation(self):
-        """Test skill gap model validation."""
-        skill_gap = SkillGap(
-            id="gap_1",
-            user_id="test_user_123",
-            skill_name="React Native",
-            current_level=SkillLevel.BEGINNER,
-            target_level=SkillLevel.INTERMEDIATE,
-            gap_size=2.0,
-            category="technical_skills",
-            priority_score=8.5,
-            created_at=datetime.now(timezone.utc)
-        )
-        
-        assert skill_gap.id == "gap_1"
-        assert skill_gap.user_id == "test_user_123"
-        assert skill_gap.skill_name == "React Native"
-        assert skill_gap.current_level == SkillLevel.BEGINNER
-        assert skill_gap.target_level == SkillLevel.INTERMEDIATE
-        assert skill_gap.gap_size == 2.0
-        assert skill_gap.category == "technical_skills"
-        assert skill_gap.priority_score == 8.5
-        assert skill_gap.created_at is not None
-    
-    def test_user_profile_model_validation(self):
-        """Test user profile model validation."""
-        user_profile = UserProfile(
-            id="test_user_123",
-            username="testuser",
-            email="test@example.com",
-            current_role="Product Manager",
-            years_of_experience=3,
-            industry="Technology",
-            team_size=5,
-            current_projects=[
-                Mock(name="Mobile App Project"),
-                Mock(name="Data Analytics Initiative")
-            ],
-            skills=[],
-            preferences=UserPreferences(),
-            context=UserContext(user_id="test_user_123")
-        )
-        
-        assert user_profile.id == "test_user_123"
-        assert user_profile.username == "testuser"
-        assert user_profile.email == "test@example.com"
-        assert user_profile.current_role == "Product Manager"
-        assert user_profile.years_of_experience == 3
-        assert user_profile.industry == "Technology"
-        assert user_profile.team_size == 5
-        assert len(user_profile.current_projects) == 2
-        assert user_profile.context.user_id == "test_user_123"
-
+        for attr, value in expected.items():
+            assert attrgetter(attr)(instance) == value
 
 if __name__ == "__main__":
     pytest.main([__file__])